@@ -5,7 +5,8 @@ from typing import Optional
 
 import click
 
-from ..db.database import find_db_path, get_session
+from ..config import get_moderails_dir as config_get_moderails_dir
+from ..db.database import get_session
 from ..services import ContextService, EpicService, SessionService, TaskService
 from ..services.history import HistoryService
 
@@ -14,8 +15,7 @@ def get_moderails_dir(db_path: Optional[Path] = None) -> Path:
     """Get the moderails directory path."""
     if db_path:
         return db_path.parent
-    found = find_db_path()
-    return found.parent if found else Path.cwd() / "moderails"
+    return config_get_moderails_dir()
 
 
 def get_services(db_path: Optional[Path] = None) -> dict:
@@ -118,7 +118,7 @@ def context_load(ctx, mandatory: bool, memory: tuple):
             output_parts.append("No mandatory context files found.")
             output_parts.append(f"Add markdown files to: {moderails_dir / 'context' / 'mandatory'}/")
     
-    # 2. Load memories by name
+    # 2. Load memories by name (single batched call - files are read concurrently)
     if memory:
         memory_content = services["context"].load_memories(list(memory))
         
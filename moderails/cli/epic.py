@@ -28,11 +28,12 @@ def epic_create(ctx, name: str, skills: tuple):
         # Add skills if provided
         if skills:
             available_skills = services["context"].list_skills()
+            available_set = set(available_skills)
             added = []
             invalid = []
             
             for skill in skills:
-                if skill in available_skills:
+                if skill in available_set:
                     if e.add_skill(skill):
                         added.append(skill)
                 else:
@@ -80,7 +81,8 @@ def epic_update(ctx, epic_id: str, name: Optional[str], add_skill: Optional[str]
         if add_skill:
             # Validate skill exists
             available_skills = services["context"].list_skills()
-            if add_skill not in available_skills:
+            available_set = set(available_skills)
+            if add_skill not in available_set:
                 click.echo(f"❌ Skill '{add_skill}' not found in skills/ directory")
                 click.echo(f"Available: {', '.join(available_skills) if available_skills else 'none'}")
                 return
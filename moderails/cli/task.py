@@ -53,11 +53,15 @@ def task_create(ctx, name: str, description: Optional[str], epic: Optional[str],
         if task_status == TaskStatus.IN_PROGRESS:
             services["session"].ensure_active(task.id)
         
-        click.echo(f"✅ Task created: {task.id} - {click.style(task.name, fg='green', bold=True)}")
-        click.echo(f"   Type: {task.type.value}")
+        # Build the whole message first and write it once
+        lines = [
+            f"✅ Task created: {task.id} - {click.style(task.name, fg='green', bold=True)}",
+            f"   Type: {task.type.value}",
+        ]
         if epic_obj:
-            click.echo(f"   Epic: {epic_obj.id} - {epic_obj.name}")
-        click.echo(f"   Status: {task.status.value}")
+            lines.append(f"   Epic: {epic_obj.id} - {epic_obj.name}")
+        lines.append(f"   Status: {task.status.value}")
+        click.echo("\n".join(lines))
         
         return task
     except ValueError as e:
@@ -154,6 +158,7 @@ def task_complete(ctx, task_id: str, summary: Optional[str], commit_message: Opt
     history_path = moderails_dir / "history.jsonl"
     private_mode = is_private_mode()
     use_git = is_git_repo()
+    staged_files: list[str] = []
     
     if use_git:
         # Git workflow: require staged files and commit message
@@ -182,7 +187,8 @@ def task_complete(ctx, task_id: str, summary: Optional[str], commit_message: Opt
         services["session"].delete_for_task(task_id)
         
         # Export to history.jsonl
-        services["history"].export_task(task_id)
+        # Reuse the staged file list checked above instead of another git call
+        services["history"].export_task(task_id, files_changed=staged_files)
         click.echo("✅ Exported to history.jsonl")
         
         # Git workflow: commit and update hash
@@ -1,6 +1,8 @@
 """Configuration management for moderails."""
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -9,43 +11,90 @@ from . import __version__
 
 MODERAILS_DIR = "_moderails"
 CONFIG_FILENAME = "config.json"
+DB_FILENAME = "moderails.db"
 
 
 def get_default_config(private: bool = False) -> dict:
     """Return default config with current version."""
+    # Copy so callers can mutate the result without touching the cache
+    return dict(_default_config(private))
+
+
+@lru_cache(maxsize=2)
+def _default_config(private: bool) -> dict:
     return {"version": __version__, "private": private}
 
 
-def find_config_path(start_path: Optional[Path] = None) -> Optional[Path]:
+def find_moderails_dir(start_path: Optional[Path] = None) -> Optional[Path]:
     """
-    Find config.json by walking up from start_path.
+    Find the _moderails directory (the one containing config.json) by walking up from start_path.
+    
+    This is the single directory walk behind find_config_path, get_moderails_dir,
+    get_db_path and find_db_path. Results are cached per resolved start directory
+    (a cached hit is re-checked, so a removed config isn't returned); call
+    clear_config_cache() after config files are created.
     
     Args:
         start_path: Starting directory (defaults to cwd)
         
     Returns:
-        Path to config.json if found, None otherwise
+        Path to the _moderails directory if found, None otherwise
     """
     if start_path is None:
         start_path = Path.cwd()
     
-    current = start_path.resolve()
-    
-    # Walk up the directory tree
-    while current != current.parent:
-        # Check for config in _moderails/config.json
-        config_path = current / MODERAILS_DIR / CONFIG_FILENAME
-        if config_path.exists():
-            return config_path
-        current = current.parent
+    start_path = start_path.resolve()
+    moderails_dir = _find_moderails_dir_cached(start_path)
+    if moderails_dir is not None and not (moderails_dir / CONFIG_FILENAME).is_file():
+        # Removed since it was found - walk again
+        _find_moderails_dir_cached.cache_clear()
+        moderails_dir = _find_moderails_dir_cached(start_path)
+    return moderails_dir
+
+
+@lru_cache(maxsize=32)
+def _find_moderails_dir_cached(start_path: Path) -> Optional[Path]:
+    """Walk up from an already-resolved start_path looking for _moderails/config.json."""
+    # Walk ancestors with a string cursor - Path is only built on a hit
+    current = str(start_path)
+    parent = os.path.dirname(current)
+    
+    # Stop before the filesystem root (matches the previous Path-based walk)
+    while parent != current:
+        candidate = os.path.join(current, MODERAILS_DIR)
+        if os.path.isfile(os.path.join(candidate, CONFIG_FILENAME)):
+            return Path(candidate)
+        current, parent = parent, os.path.dirname(parent)
     
     return None
 
 
+def find_config_path(start_path: Optional[Path] = None) -> Optional[Path]:
+    """
+    Find config.json by walking up from start_path.
+    
+    Args:
+        start_path: Starting directory (defaults to cwd)
+        
+    Returns:
+        Path to config.json if found, None otherwise
+    """
+    moderails_dir = find_moderails_dir(start_path)
+    return moderails_dir / CONFIG_FILENAME if moderails_dir else None
+
+
+def clear_config_cache() -> None:
+    """Forget cached directory walks (after config files are created or removed)."""
+    _find_moderails_dir_cached.cache_clear()
+
+
 def load_config(config_path: Optional[Path] = None) -> dict:
     """
     Load configuration from config.json.
     
+    Parsed configs are cached by (path, mtime) so repeated lookups within
+    one command don't re-read the file.
+    
     Args:
         config_path: Explicit path to config.json (auto-discovers if None)
         
@@ -55,17 +104,29 @@ def load_config(config_path: Optional[Path] = None) -> dict:
     if config_path is None:
         config_path = find_config_path()
     
-    if config_path and config_path.exists():
+    if config_path:
         try:
-            with open(config_path, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        
+        if mtime_ns is not None:
+            try:
+                return dict(_load_config_cached(str(config_path), mtime_ns))
+            except (json.JSONDecodeError, OSError):
+                pass
     
     # Return defaults
     return get_default_config()
 
 
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> dict:
+    """Parse config.json; mtime_ns is part of the cache key only."""
+    # Single read() and bytes decoding in the C JSON parser
+    return json.loads(Path(config_path).read_bytes())
+
+
 def save_config(config: dict) -> Path:
     """
     Save configuration to config.json in _moderails directory.
@@ -83,6 +144,9 @@ def save_config(config: dict) -> Path:
     with open(config_path, "w") as f:
         json.dump(config, f, indent=2)
     
+    # A new config may change the result of earlier directory walks
+    clear_config_cache()
+    
     return config_path
 
 
@@ -98,9 +162,10 @@ def get_moderails_dir(config_path: Optional[Path] = None) -> Path:
     """
     # If config exists, use its parent directory
     if config_path is None:
-        config_path = find_config_path()
-    
-    if config_path and config_path.exists():
+        found = find_moderails_dir()
+        if found:
+            return found
+    elif config_path.exists():
         return config_path.parent
     
     # Otherwise, use current directory
@@ -117,8 +182,7 @@ def get_db_path(config_path: Optional[Path] = None) -> Path:
     Returns:
         Path to moderails.db
     """
-    moderails_dir = get_moderails_dir(config_path)
-    return moderails_dir / "moderails.db"
+    return get_moderails_dir(config_path) / DB_FILENAME
 
 
 def is_private_mode(config_path: Optional[Path] = None) -> bool:
@@ -1,6 +1,26 @@
-"""Database module."""
+"""Database module.
 
-from .database import get_db, init_db, find_db_path
-from .models import Base, Epic, Task, TaskStatus
+Submodules are imported lazily (PEP 562) so importing moderails.db does not
+pull in SQLAlchemy until a database object is actually used.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "get_db": ".database",
+    "init_db": ".database",
+    "find_db_path": ".database",
+    "Base": ".models",
+    "Epic": ".models",
+    "Task": ".models",
+    "TaskStatus": ".models",
+}
 
 __all__ = ["get_db", "init_db", "find_db_path", "Base", "Epic", "Task", "TaskStatus"]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -1,22 +1,57 @@
 """Database connection and auto-discovery."""
 
+import os
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from ..config import (
+    DB_FILENAME,
+    clear_config_cache,
+    find_moderails_dir,
+    get_db_path as config_get_db_path,
+    get_default_config,
+    save_config,
+)
+from ..templates import read_template_bytes
 
-from ..config import find_config_path, get_db_path as config_get_db_path, get_default_config, save_config
-from ..templates import get_template_path
+# SQLAlchemy is imported inside the functions that need it to keep CLI startup fast
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import Session, sessionmaker
 
-# Module-level engine and session factory
-_engine = None
-_SessionLocal = None
+# Engine and session factory per context (thread / async task), created lazily
+_engine_var: ContextVar[Optional[tuple["Engine", "sessionmaker"]]] = ContextVar("_engine", default=None)
+
+# Single-user CLI tuning: WAL groups commits, NORMAL skips redundant fsyncs,
+# and a larger page cache (negative = KiB, allocated only as pages are read)
+# keeps the whole database in memory for the life of the connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
+
+# WAL mode's sidecar files. gitignore.txt ignores them, but .gitignore files
+# written before WAL was enabled get them on upgrade (see run_migrations)
+SQLITE_SIDECAR_PATTERNS = ("*.db-wal", "*.db-shm")
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record=None) -> None:
+    """Apply SQLITE_PRAGMAS to a new DBAPI connection (engine "connect" hook)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
 
 def find_db_path(start_path: Optional[Path] = None) -> Optional[Path]:
     """
-    Find moderails.db by using config.json to determine the path.
+    Find moderails.db next to the discovered config.json.
     
     Args:
         start_path: Starting directory (defaults to cwd)
@@ -24,9 +59,11 @@ def find_db_path(start_path: Optional[Path] = None) -> Optional[Path]:
     Returns:
         Path to moderails.db if found, None otherwise
     """
-    config_path = find_config_path(start_path)
-    if config_path:
-        db_path = config_get_db_path(config_path)
+    moderails_dir = find_moderails_dir(start_path)
+    if moderails_dir:
+        db_path = moderails_dir / DB_FILENAME
+        # Config may exist without a database (e.g. deleted db) - don't let
+        # SQLite silently create an empty, unmigrated file
         if db_path.exists():
             return db_path
     
@@ -47,21 +84,16 @@ def init_db(private: bool = False) -> Path:
     config = get_default_config(private=private)
     config_path = save_config(config)
     
-    # Get db path from config
+    # Get db path from config (save_config already created its directory)
     db_path = config_get_db_path(config_path)
     
-    # Create directory if needed
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    
     # Initialize database schema with migrations
     from .migrations import init_schema
     init_schema(db_path)
     
     # Create .gitignore in moderails directory (always use standard template)
     gitignore_path = db_path.parent / ".gitignore"
-    gitignore_template = get_template_path("gitignore.txt")
-    gitignore_content = gitignore_template.read_text()
-    gitignore_path.write_text(gitignore_content)
+    gitignore_path.write_bytes(read_template_bytes("gitignore.txt"))
     
     # In private mode, add pattern to project's root .gitignore
     if private:
@@ -70,46 +102,79 @@ def init_db(private: bool = False) -> Path:
         
         private_pattern = "*moderails*"
         
-        # Read existing content or start fresh
-        existing_content = ""
-        if root_gitignore.exists():
-            existing_content = root_gitignore.read_text()
+        # Read existing content once (missing file means empty)
+        try:
+            existing_content = root_gitignore.read_bytes()
+        except FileNotFoundError:
+            existing_content = b""
         
-        # Add pattern if it doesn't already exist
-        if private_pattern not in existing_content:
-            new_content = existing_content.rstrip()
-            if new_content and not new_content.endswith("\n"):
-                new_content += "\n"
-            if new_content:
-                new_content += "\n"
-            new_content += f"{private_pattern}\n"
-            root_gitignore.write_text(new_content)
-    
-    # Create context directories
-    context_dir = db_path.parent / "context"
-    context_dir.mkdir(exist_ok=True)
+        # Append pattern if it doesn't already exist, writing only the delta
+        if private_pattern.encode() not in existing_content:
+            delta = b""
+            if existing_content.strip():
+                if not existing_content.endswith(b"\n"):
+                    delta += b"\n"
+                delta += b"\n"
+            delta += f"{private_pattern}\n".encode()
+            
+            fd = os.open(root_gitignore, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+            with os.fdopen(fd, "wb") as f:
+                f.write(delta)
     
-    mandatory_dir = context_dir / "mandatory"
-    mandatory_dir.mkdir(exist_ok=True)
-    
-    memories_dir = context_dir / "memories"
-    memories_dir.mkdir(exist_ok=True)
+    # Create context directories (parents=True also creates context/)
+    context_dir = db_path.parent / "context"
+    for leaf_dir in (context_dir / "mandatory", context_dir / "memories"):
+        leaf_dir.mkdir(parents=True, exist_ok=True)
     
     # Create README in context directory
     context_readme = context_dir / "README.md"
-    if not context_readme.exists():
-        readme_template = get_template_path("context-readme.md")
-        context_readme_content = readme_template.read_text()
-        context_readme.write_text(context_readme_content)
+    _create_if_absent(context_readme, lambda: read_template_bytes("context-readme.md"))
     
     # Create empty history.jsonl file
     history_file = db_path.parent / "history.jsonl"
-    if not history_file.exists():
-        history_file.touch()
+    _create_if_absent(history_file, lambda: b"")
     
     return db_path
 
 
+def add_gitignore_patterns(gitignore_path: Path, patterns: tuple[str, ...]) -> bool:
+    """
+    Append the patterns an existing .gitignore doesn't list yet.
+    
+    Args:
+        gitignore_path: .gitignore to update (left alone if it doesn't exist)
+        patterns: Patterns that should be listed, one per line
+        
+    Returns:
+        True if any pattern was added
+    """
+    try:
+        existing_content = gitignore_path.read_bytes()
+    except FileNotFoundError:
+        return False
+    
+    listed = {line.strip() for line in existing_content.splitlines()}
+    missing = [pattern for pattern in patterns if pattern.encode() not in listed]
+    if not missing:
+        return False
+    
+    delta = b"" if not existing_content or existing_content.endswith(b"\n") else b"\n"
+    delta += "".join(f"{pattern}\n" for pattern in missing).encode()
+    with open(gitignore_path, "ab") as f:
+        f.write(delta)
+    return True
+
+
+def _create_if_absent(path: Path, content: Callable[[], bytes]) -> None:
+    """Create path with content() unless it already exists (single O_EXCL open)."""
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    except FileExistsError:
+        return
+    with os.fdopen(fd, "wb") as f:
+        f.write(content())
+
+
 def get_engine(db_path: Optional[Path] = None):
     """
     Get or create database engine.
@@ -123,10 +188,13 @@ def get_engine(db_path: Optional[Path] = None):
     Raises:
         FileNotFoundError: If no database found and db_path not specified
     """
-    global _engine
+    state = _engine_var.get()
+    if state is not None:
+        return state[0]
     
-    if _engine is not None:
-        return _engine
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
     
     if db_path is None:
         db_path = find_db_path()
@@ -135,11 +203,21 @@ def get_engine(db_path: Optional[Path] = None):
                 "No moderails database found. Run 'moderails init' to create one."
             )
     
-    _engine = create_engine(f"sqlite:///{db_path}", echo=False)
-    return _engine
+    # Single shared connection for the CLI process - no re-open per session
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    # Objects stay usable after commit without a reload round trip
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    _engine_var.set((engine, session_factory))
+    return engine
 
 
-def get_session(db_path: Optional[Path] = None) -> Session:
+def get_session(db_path: Optional[Path] = None) -> "Session":
     """
     Get a new database session.
     
@@ -149,14 +227,9 @@ def get_session(db_path: Optional[Path] = None) -> Session:
     Returns:
         SQLAlchemy session
     """
-    global _SessionLocal
-    
-    engine = get_engine(db_path)
-    
-    if _SessionLocal is None:
-        _SessionLocal = sessionmaker(bind=engine)
-    
-    return _SessionLocal()
+    get_engine(db_path)
+    _, session_factory = _engine_var.get()
+    return session_factory()
 
 
 def get_db(db_path: Optional[Path] = None):
@@ -179,7 +252,9 @@ def get_db(db_path: Optional[Path] = None):
 
 
 def reset_engine():
-    """Reset the global engine (for testing)."""
-    global _engine, _SessionLocal
-    _engine = None
-    _SessionLocal = None
+    """Reset this context's engine and cached config lookups (for testing)."""
+    state = _engine_var.get()
+    if state is not None:
+        state[0].dispose()
+    _engine_var.set(None)
+    clear_config_cache()
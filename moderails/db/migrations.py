@@ -1,7 +1,13 @@
 """Simple SQL-based database migrations."""
 
+import os
+import sqlite3
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from sqlalchemy import create_engine, text
+from typing import Iterator, Optional
+
+from .database import SQLITE_SIDECAR_PATTERNS, add_gitignore_patterns, apply_sqlite_pragmas
 
 # Migration scripts - each key is a version number
 MIGRATIONS = {
@@ -47,116 +53,212 @@ MIGRATIONS = {
         -- Add description column to tasks (context for draft tickets)
         ALTER TABLE tasks ADD COLUMN description TEXT DEFAULT '';
     """,
+    5: """
+        -- Index frequently filtered/sorted task columns. The composite index
+        -- serves completed-tasks-per-epic queries (epic summary), and its
+        -- leading column also serves epic_id lookups
+        CREATE INDEX IF NOT EXISTS ix_tasks_status ON tasks(status);
+        CREATE INDEX IF NOT EXISTS ix_tasks_created_at ON tasks(created_at);
+        CREATE INDEX IF NOT EXISTS ix_tasks_epic_status_completed ON tasks(epic_id, status, completed_at);
+    """,
+    6: """
+        -- Rebuild tasks with the CHECK constraints on type/status (SQLite can't
+        -- add them to an existing table). Types and statuses are stored as enum
+        -- member names: rows holding enum values are converted, and anything
+        -- unrecognised falls back to the column default.
+        BEGIN;
+        
+        CREATE TABLE tasks_new (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            file_name TEXT NOT NULL,
+            summary TEXT,
+            description TEXT DEFAULT '',
+            type TEXT,
+            status TEXT,
+            git_hash TEXT,
+            completed_at DATETIME,
+            epic_id TEXT,
+            created_at DATETIME,
+            FOREIGN KEY (epic_id) REFERENCES epics(id),
+            CONSTRAINT ck_task_type CHECK (type IN ('FEATURE', 'FIX', 'REFACTOR', 'CHORE')),
+            CONSTRAINT ck_task_status CHECK (status IN ('DRAFT', 'IN_PROGRESS', 'COMPLETED'))
+        );
+        
+        INSERT INTO tasks_new (
+            id, name, file_name, summary, description, type, status,
+            git_hash, completed_at, epic_id, created_at
+        )
+        SELECT
+            id, name, file_name, summary, description,
+            CASE
+                WHEN type IS NULL THEN NULL
+                WHEN upper(type) IN ('FEATURE', 'FIX', 'REFACTOR', 'CHORE') THEN upper(type)
+                ELSE 'FEATURE'
+            END,
+            CASE
+                WHEN status IS NULL THEN NULL
+                WHEN replace(upper(status), '-', '_') IN ('DRAFT', 'IN_PROGRESS', 'COMPLETED')
+                    THEN replace(upper(status), '-', '_')
+                ELSE 'DRAFT'
+            END,
+            git_hash, completed_at, epic_id, created_at
+        FROM tasks;
+        
+        DROP TABLE tasks;
+        ALTER TABLE tasks_new RENAME TO tasks;
+        
+        CREATE INDEX ix_tasks_status ON tasks(status);
+        CREATE INDEX ix_tasks_created_at ON tasks(created_at);
+        CREATE INDEX ix_tasks_epic_status_completed ON tasks(epic_id, status, completed_at);
+        
+        COMMIT;
+    """,
 }
 
 CURRENT_VERSION = max(MIGRATIONS.keys())
 
+# ADD COLUMN migrations are skipped when the column already exists
+# (e.g. databases created from models before the migration was added)
+MIGRATION_COLUMN_GUARDS: dict[int, tuple[str, str]] = {
+    2: ("epics", "skills"),
+    4: ("tasks", "description"),
+}
 
-def get_schema_version(db_path: Path) -> int:
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open a plain sqlite3 connection for migration work with PRAGMAs applied."""
+    conn = sqlite3.connect(str(db_path))
+    apply_sqlite_pragmas(conn)
+    return conn
+
+
+@contextmanager
+def _connection_scope(db_path: Path, conn: Optional[sqlite3.Connection] = None) -> Iterator[sqlite3.Connection]:
+    """Yield the given connection, or a temporary one closed on exit."""
+    if conn is not None:
+        yield conn
+        return
+    
+    conn = connect(db_path)
+    try:
+        yield conn
+    finally:
+        conn.close()
+        # id() of a closed connection may be reused by the next one
+        _table_columns_cache.clear()
+
+
+def get_schema_version(db_path: Path, conn: Optional[sqlite3.Connection] = None) -> int:
     """Get current schema version from database.
     
+    Args:
+        db_path: Path to the database
+        conn: Optional connection to reuse (a temporary one is opened if None)
+    
     Returns:
         Schema version number, or 0 if not set
     """
-    engine = create_engine(f"sqlite:///{db_path}")
-    
     try:
-        with engine.connect() as conn:
+        with _connection_scope(db_path, conn) as conn:
             # Check if schema_version table exists
-            result = conn.execute(text(
+            row = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='schema_version'"
-            ))
+            ).fetchone()
             
-            if not result.fetchone():
+            if not row:
                 return 0
             
             # Get version
-            result = conn.execute(text("SELECT version FROM schema_version LIMIT 1"))
-            row = result.fetchone()
+            row = conn.execute("SELECT version FROM schema_version LIMIT 1").fetchone()
             return row[0] if row else 0
     except Exception:
         return 0
-    finally:
-        engine.dispose()
 
 
-def set_schema_version(db_path: Path, version: int) -> None:
+def set_schema_version(db_path: Path, version: int, conn: Optional[sqlite3.Connection] = None) -> None:
     """Set schema version in database."""
-    engine = create_engine(f"sqlite:///{db_path}")
+    with _connection_scope(db_path, conn) as conn:
+        # Create table if needed
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY
+            )
+        """)
+        
+        # Update or insert version
+        conn.execute("DELETE FROM schema_version")
+        conn.execute("INSERT INTO schema_version (version) VALUES (?)", (version,))
+        conn.commit()
     
-    try:
-        with engine.connect() as conn:
-            # Create table if needed
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS schema_version (
-                    version INTEGER PRIMARY KEY
-                )
-            """))
-            
-            # Update or insert version
-            conn.execute(text("DELETE FROM schema_version"))
-            conn.execute(text(f"INSERT INTO schema_version (version) VALUES ({version})"))
-            conn.commit()
-    finally:
-        engine.dispose()
+    _cached_schema_version.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _cached_schema_version(db_path: str, mtime_ns: int) -> int:
+    """Schema version keyed by (path, mtime_ns) so unchanged files skip the DB open."""
+    return get_schema_version(Path(db_path))
 
 
 def needs_migration(db_path: Path) -> bool:
     """Check if database needs migration."""
-    if not db_path.exists():
+    try:
+        mtime_ns = os.stat(db_path).st_mtime_ns
+    except FileNotFoundError:
         return False
     
-    current = get_schema_version(db_path)
+    current = _cached_schema_version(str(db_path), mtime_ns)
     return current < CURRENT_VERSION
 
 
-def column_exists(conn, table: str, column: str) -> bool:
+# PRAGMA table_info results per (connection id, table); cleared after any DDL
+_table_columns_cache: dict[tuple[int, str], frozenset[str]] = {}
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> frozenset[str]:
+    """Get column names for a table, reusing earlier PRAGMA results on this connection."""
+    key = (id(conn), table)
+    columns = _table_columns_cache.get(key)
+    if columns is None:
+        rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
+        columns = frozenset(row[1] for row in rows)
+        _table_columns_cache[key] = columns
+    return columns
+
+
+def column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
     """Check if a column exists in a table."""
-    result = conn.execute(text(f"PRAGMA table_info({table})"))
-    columns = [row[1] for row in result.fetchall()]
-    return column in columns
+    return column in _table_columns(conn, table)
 
 
-def run_migration(db_path: Path, version: int) -> None:
+def run_migration(db_path: Path, version: int, conn: Optional[sqlite3.Connection] = None) -> None:
     """Run a specific migration."""
     if version not in MIGRATIONS:
         raise ValueError(f"Migration version {version} not found")
     
-    engine = create_engine(f"sqlite:///{db_path}")
-    
-    try:
-        with engine.connect() as conn:
-            # Handle migration 2 specially - check if column exists first
-            if version == 2:
-                if column_exists(conn, "epics", "skills"):
-                    conn.commit()
-                    return
-            if version == 4:
-                if column_exists(conn, "tasks", "description"):
-                    conn.commit()
-                    return
-
-            # Split migration into separate statements (SQLite limitation)
-            migration_sql = MIGRATIONS[version]
-            statements = [s.strip() for s in migration_sql.split(';') if s.strip()]
-            
-            # Execute each statement separately
-            for statement in statements:
-                conn.execute(text(statement))
-            
-            conn.commit()
-    finally:
-        engine.dispose()
+    with _connection_scope(db_path, conn) as conn:
+        guard = MIGRATION_COLUMN_GUARDS.get(version)
+        if guard and column_exists(conn, *guard):
+            return
+        
+        # executescript handles multiple ;-separated statements natively
+        conn.executescript(MIGRATIONS[version])
+        conn.commit()
+        _table_columns_cache.clear()
 
 
 def run_migrations(db_path: Path) -> None:
-    """Run all pending migrations sequentially."""
-    current_version = get_schema_version(db_path)
+    """Run all pending migrations sequentially on a single connection."""
+    with _connection_scope(db_path) as conn:
+        current_version = get_schema_version(db_path, conn)
+        
+        # Run migrations from current+1 to latest
+        for version in range(current_version + 1, CURRENT_VERSION + 1):
+            run_migration(db_path, version, conn)
+            set_schema_version(db_path, version, conn)
     
-    # Run migrations from current+1 to latest
-    for version in range(current_version + 1, CURRENT_VERSION + 1):
-        run_migration(db_path, version)
-        set_schema_version(db_path, version)
+    # .gitignore is only written by init - bring older ones up to date
+    add_gitignore_patterns(db_path.parent / ".gitignore", SQLITE_SIDECAR_PATTERNS)
 
 
 def auto_migrate(db_path: Path) -> bool:
@@ -174,9 +276,10 @@ def auto_migrate(db_path: Path) -> bool:
 
 def init_schema(db_path: Path) -> None:
     """Initialize a fresh database with current schema."""
-    # Run all migrations sequentially
-    for version in range(1, CURRENT_VERSION + 1):
-        run_migration(db_path, version)
-    
-    # Set to current version
-    set_schema_version(db_path, CURRENT_VERSION)
+    with _connection_scope(db_path) as conn:
+        # Run all migrations sequentially
+        for version in range(1, CURRENT_VERSION + 1):
+            run_migration(db_path, version, conn)
+        
+        # Set to current version
+        set_schema_version(db_path, CURRENT_VERSION, conn)
@@ -1,24 +1,104 @@
 """SQLAlchemy models for moderails."""
 
-import secrets
+import json
+import os
 import string
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, Enum as SQLEnum, ForeignKey, String, Text
+from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, String, Text, TypeDecorator, func
 from sqlalchemy.orm import DeclarativeBase, relationship
 
+# Bound once - JSONList calls these for every row loaded or saved
+_loads = json.loads
+_dumps = json.dumps
+
+TASK_ID_ALPHABET = string.ascii_lowercase + string.digits
+TASK_ID_LENGTH = 6
+
 
 def generate_task_id() -> str:
-    """Generate a 6-character alphanumeric task ID."""
-    chars = string.ascii_lowercase + string.digits
-    return ''.join(secrets.choice(chars) for _ in range(6))
+    """Generate a 6-character alphanumeric task ID.
+    
+    Draws 40 random bits in one urandom call and converts them to base 36
+    (36**6 is ~31 bits, so the modulo bias is negligible).
+    """
+    raw = int.from_bytes(os.urandom(5), "little")
+    chars = []
+    for _ in range(TASK_ID_LENGTH):
+        raw, index = divmod(raw, 36)
+        chars.append(TASK_ID_ALPHABET[index])
+    return ''.join(chars)
+
+
+def utc_now_sql():
+    """SQL expression for the current UTC time, evaluated by SQLite.
+    
+    Used as a column default so INSERTs don't call into Python per row.
+    CURRENT_TIMESTAMP only has second precision, so keep milliseconds.
+    """
+    return func.strftime("%Y-%m-%d %H:%M:%f", "now")
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class EnumName(TypeDecorator):
+    """Store a Python Enum by member name in a plain VARCHAR column.
+    
+    Same on-disk format as SQLAlchemy's Enum type (member names), but rows
+    load through a dict lookup instead of SQLAlchemy's enum coercion.
+    """
+    impl = String
+    cache_ok = True
+    
+    def __init__(self, enum_class: type[Enum], length: int = 16):
+        super().__init__(length)
+        self.enum_class = enum_class
+        self._members = enum_class.__members__
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, self.enum_class):
+            return value.name
+        # Accept raw values (e.g. "in-progress") like the Enum type did
+        return self.enum_class(value).name
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[value]
+
+
+def enum_check(column: str, enum_class: type[Enum]) -> CheckConstraint:
+    """CHECK constraint limiting column to the member names of enum_class."""
+    names = ", ".join(f"'{name}'" for name in enum_class.__members__)
+    return CheckConstraint(f"{column} IN ({names})", name=f"ck_task_{column}")
+
+
+class JSONList(TypeDecorator):
+    """JSON array stored in a TEXT column, decoded to a Python list on load.
+    
+    Same on-disk format as the previous hand-serialized TEXT columns, so no
+    data migration is needed; invalid or NULL values load as an empty list.
+    """
+    impl = Text
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return _dumps(list(value))
+    
+    def process_result_value(self, value, dialect):
+        try:
+            return _loads(value or "[]")
+        except json.JSONDecodeError:
+            return []
+
+
 class TaskStatus(str, Enum):
     DRAFT = "draft"
     IN_PROGRESS = "in-progress"
@@ -32,34 +112,35 @@ class TaskType(str, Enum):
     CHORE = "chore"
 
 
+# Member -> value tables for serialization (avoids Enum.value descriptor calls)
+_TASK_STATUS_VALUES = {member: member.value for member in TaskStatus}
+_TASK_TYPE_VALUES = {member: member.value for member in TaskType}
+
+
 class Epic(Base):
     __tablename__ = "epics"
     
     id: str = Column(String(6), primary_key=True, default=generate_task_id)
     name: str = Column(String(255), nullable=False, unique=True)
-    skills: str = Column(Text, default="[]")  # JSON array of skill names
+    skills: list[str] = Column(JSONList, default=list)  # skill names
     
-    tasks = relationship("Task", back_populates="epic")
+    # Collection is rarely needed - keep it lazy so listing epics stays one query
+    tasks = relationship("Task", back_populates="epic", lazy="select")
     
     def get_skills(self) -> list[str]:
         """Get skills as a list."""
-        import json
-        try:
-            return json.loads(self.skills or "[]")
-        except json.JSONDecodeError:
-            return []
+        return list(self.skills or [])
     
     def set_skills(self, skill_list: list[str]) -> None:
         """Set skills from a list."""
-        import json
-        self.skills = json.dumps(skill_list)
+        # Assign a new list so SQLAlchemy detects the change
+        self.skills = list(skill_list)
     
     def add_skill(self, skill_name: str) -> bool:
         """Add a skill if not already present. Returns True if added."""
         skills = self.get_skills()
         if skill_name not in skills:
-            skills.append(skill_name)
-            self.set_skills(skills)
+            self.set_skills(skills + [skill_name])
             return True
         return False
     
@@ -67,8 +148,7 @@ class Epic(Base):
         """Remove a skill if present. Returns True if removed."""
         skills = self.get_skills()
         if skill_name in skills:
-            skills.remove(skill_name)
-            self.set_skills(skills)
+            self.set_skills([s for s in skills if s != skill_name])
             return True
         return False
     
@@ -82,20 +162,33 @@ class Epic(Base):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Added to existing databases by migration 6
+        enum_check("type", TaskType),
+        enum_check("status", TaskStatus),
+        # Serves EpicService.get_summary (epic + status filter, completed_at order)
+        # and plain epic_id lookups via its leading column
+        Index("ix_tasks_epic_status_completed", "epic_id", "status", "completed_at"),
+    )
+    # Fetch the SQL-computed created_at via INSERT ... RETURNING so new tasks
+    # are complete without a refresh
+    __mapper_args__ = {"eager_defaults": True}
     
     id: str = Column(String(6), primary_key=True, default=generate_task_id)
     name: str = Column(String(255), nullable=False)
     file_name: str = Column(String(255), nullable=False)
     summary: str = Column(Text, default="")
     description: str = Column(Text, default="")
-    type: TaskType = Column(SQLEnum(TaskType), default=TaskType.FEATURE)
-    status: TaskStatus = Column(SQLEnum(TaskStatus), default=TaskStatus.DRAFT)
+    type: TaskType = Column(EnumName(TaskType), default=TaskType.FEATURE)
+    status: TaskStatus = Column(EnumName(TaskStatus), default=TaskStatus.DRAFT, index=True)
     git_hash: str = Column(String(40), default="")
     completed_at: datetime = Column(DateTime, nullable=True)
     epic_id: str = Column(String(6), ForeignKey("epics.id"), nullable=True)
-    created_at: datetime = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Column(DateTime, default=utc_now_sql(), index=True)
     
-    epic = relationship("Epic", back_populates="tasks")
+    # Single-valued and used by most task displays - load it in the same query
+    epic = relationship("Epic", back_populates="tasks", lazy="joined")
+    session = relationship("Session", back_populates="task", uselist=False)
     
     @property
     def file_path(self) -> str:
@@ -103,19 +196,22 @@ class Task(Base):
         return f"_moderails/{self.file_name}"
     
     def to_dict(self) -> dict:
+        completed_at = self.completed_at
+        created_at = self.created_at
         return {
             "id": self.id,
             "name": self.name,
             "file_name": self.file_name,
             "summary": self.summary,
             "description": self.description,
-            "type": self.type.value,
-            "status": self.status.value,
+            "type": _TASK_TYPE_VALUES[self.type],
+            "status": _TASK_STATUS_VALUES[self.status],
+            # epic is loaded with the task (lazy="joined") - no extra query
             "epic": self.epic.name if self.epic else None,
             "epic_id": self.epic_id,
             "git_hash": self.git_hash,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "completed_at": completed_at.isoformat() if completed_at else None,
+            "created_at": created_at.isoformat() if created_at else None,
         }
 
 
@@ -126,40 +222,40 @@ class Session(Base):
     becomes in-progress and deleted when the task completes.
     """
     __tablename__ = "sessions"
+    # Fetch the SQL-computed updated_at via UPDATE ... RETURNING instead of
+    # expiring it and lazy-loading on next access
+    __mapper_args__ = {"eager_defaults": True}
     
     id: str = Column(String(6), primary_key=True, default=generate_task_id)
     task_id: str = Column(String(6), ForeignKey("tasks.id"), unique=True, nullable=False)
     current_mode: str = Column(String(20), default="start")
-    loaded_memories: str = Column(Text, default="[]")  # JSON array of memory names
-    created_at: datetime = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    loaded_memories: list[str] = Column(JSONList, default=list)  # memory names
+    created_at: datetime = Column(DateTime, default=utc_now_sql())
+    updated_at: datetime = Column(DateTime, default=utc_now_sql(), onupdate=utc_now_sql())
     
-    task = relationship("Task", backref="session", uselist=False)
+    task = relationship("Task", back_populates="session")
     
     def get_memories(self) -> list[str]:
         """Get loaded memories as a list."""
-        import json
-        try:
-            return json.loads(self.loaded_memories or "[]")
-        except json.JSONDecodeError:
-            return []
+        return list(self.loaded_memories or [])
     
     def add_memory(self, memory_name: str) -> bool:
         """Add a memory if not already loaded. Returns True if added."""
-        import json
         memories = self.get_memories()
         if memory_name not in memories:
-            memories.append(memory_name)
-            self.loaded_memories = json.dumps(memories)
+            # Assign a new list so SQLAlchemy detects the change
+            self.loaded_memories = memories + [memory_name]
             return True
         return False
     
     def to_dict(self) -> dict:
+        created_at = self.created_at
+        updated_at = self.updated_at
         return {
             "id": self.id,
             "task_id": self.task_id,
             "current_mode": self.current_mode,
             "loaded_memories": self.get_memories(),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": updated_at.isoformat() if updated_at else None,
         }
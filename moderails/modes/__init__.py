@@ -8,6 +8,48 @@ from jinja2 import Environment, FileSystemLoader, TemplateError
 MODES_DIR = Path(__file__).parent
 
 MODE_ORDER = ["start", "research", "brainstorm", "plan", "execute", "complete", "close"]
+_MODE_PATHS = {mode: MODES_DIR / f"{mode}.md" for mode in MODE_ORDER}
+MODE_FILES = list(_MODE_PATHS.values())
+TASK_TEMPLATE_FILE = MODES_DIR.parent / "templates" / "task-template.md"
+
+# Decoded file contents keyed by path, validated against st_mtime_ns so
+# edited markdown is picked up without restarting the process
+_file_cache: dict[Path, tuple[int, str]] = {}
+_protocol_cache: Optional[tuple[tuple[int, ...], str]] = None
+
+# Shared environment - compiled templates (and their includes) are cached
+# by the loader and only recompiled when the source file changes
+_ENV = Environment(
+    loader=FileSystemLoader(str(MODES_DIR)),
+    autoescape=False,
+    cache_size=400,
+)
+
+
+def _file_mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _read_cached(path: Path, mtime_ns: Optional[int] = None) -> Optional[str]:
+    """Return the file's text, re-reading only when its mtime changed.
+    
+    Returns None if the file does not exist.
+    """
+    if mtime_ns is None:
+        mtime_ns = _file_mtime_ns(path)
+        if mtime_ns is None:
+            return None
+    
+    cached = _file_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    content = path.read_text()
+    _file_cache[path] = (mtime_ns, content)
+    return content
 
 
 def get_mode(mode_name: str, context: Optional[dict[str, Any]] = None) -> str:
@@ -24,20 +66,18 @@ def get_mode(mode_name: str, context: Optional[dict[str, Any]] = None) -> str:
     Returns:
         Rendered mode content
     """
-    mode_file = MODES_DIR / f"{mode_name}.md"
-    if not mode_file.exists():
+    mode_file = _MODE_PATHS.get(mode_name) or MODES_DIR / f"{mode_name}.md"
+    template_content = _read_cached(mode_file)
+    if template_content is None:
         return f"Mode file not found: {mode_name}.md"
     
-    template_content = mode_file.read_text()
-    
     # Skip templating if no Jinja syntax (backward compatible)
     if "{{" not in template_content and "{%" not in template_content:
         return template_content
     
     # Render with Jinja2 using FileSystemLoader for includes
     try:
-        env = Environment(loader=FileSystemLoader(str(MODES_DIR)), autoescape=False)
-        template = env.from_string(template_content)
+        template = _ENV.get_template(f"{mode_name}.md")
         return template.render(context or {})
     except TemplateError as e:
         # Return original content with error note if template fails
@@ -46,15 +86,26 @@ def get_mode(mode_name: str, context: Optional[dict[str, Any]] = None) -> str:
 
 def get_full_protocol() -> str:
     """Load all mode definitions concatenated."""
-    parts = []
-    for mode in MODE_ORDER:
-        mode_file = MODES_DIR / f"{mode}.md"
-        if mode_file.exists():
-            parts.append(mode_file.read_text())
-    return "\n\n---\n\n".join(parts)
+    global _protocol_cache
+    
+    # One stat per file; the joined string is reused while nothing changed
+    mtimes = tuple(_file_mtime_ns(path) for path in MODE_FILES)
+    if _protocol_cache is not None and _protocol_cache[0] == mtimes:
+        return _protocol_cache[1]
+    
+    parts = [
+        _read_cached(path, mtime_ns)
+        for path, mtime_ns in zip(MODE_FILES, mtimes)
+        if mtime_ns is not None
+    ]
+    protocol = "\n\n---\n\n".join(parts)
+    _protocol_cache = (mtimes, protocol)
+    return protocol
 
 
 def get_task_template() -> str:
     """Load task template."""
-    template_file = MODES_DIR.parent / "templates" / "task-template.md"
-    return template_file.read_text()
+    content = _read_cached(TASK_TEMPLATE_FILE)
+    if content is None:
+        raise FileNotFoundError(TASK_TEMPLATE_FILE)
+    return content
@@ -1,8 +1,38 @@
 """Context service - manages context loading and discovery."""
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
+
+# Upper bound on threads used to read memory files concurrently
+MAX_READ_WORKERS = 8
+
+
+def _read_text_or_none(file_path: Union[str, Path]) -> Optional[str]:
+    """Read a UTF-8 file, returning None if it is missing or unreadable."""
+    try:
+        # Text mode, so CRLF files come back with plain "\n" line endings
+        return Path(file_path).read_text(encoding="utf-8")
+    except Exception:
+        return None
+
+
+def _read_many(paths: list) -> list[Optional[str]]:
+    """Read several files concurrently, returning contents in input order.
+    
+    File reads release the GIL, so a small thread pool overlaps their I/O.
+    Unreadable files come back as None.
+    """
+    if len(paths) <= 1:
+        return [_read_text_or_none(p) for p in paths]
+    
+    # map() preserves input order
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(paths))) as executor:
+        return list(executor.map(_read_text_or_none, paths))
 
 
 class ContextService:
@@ -23,29 +53,31 @@ class ContextService:
         if not self.mandatory_dir.exists():
             return None
         
-        # Get all markdown files in mandatory directory
-        context_files = sorted(self.mandatory_dir.glob("*.md"))
+        # scandir yields names and file types without building a Path per entry
+        with os.scandir(self.mandatory_dir) as it:
+            context_files = sorted(
+                (entry for entry in it if entry.name.endswith(".md") and entry.is_file()),
+                key=attrgetter("name"),
+            )
         
         if not context_files:
             return None
         
         # Build context output
         context_parts = ["## MANDATORY CONTEXT\n"]
+        last = len(context_files) - 1
         
-        for i, file_path in enumerate(context_files):
-            try:
-                content = file_path.read_text()
-                context_parts.append(f"### {file_path.name}\n")
-                context_parts.append(content)
-                
-                # Add separator between files (but not after the last one)
-                if i < len(context_files) - 1:
-                    context_parts.append("\n---\n")
-                else:
-                    context_parts.append("\n")
-            except Exception:
+        contents = _read_many([entry.path for entry in context_files])
+        
+        for i, (entry, content) in enumerate(zip(context_files, contents)):
+            if content is None:
                 # Skip files that can't be read
                 continue
+            
+            context_parts.append(f"### {entry.name}\n")
+            context_parts.append(content)
+            # Add separator between files (but not after the last one)
+            context_parts.append("\n---\n" if i < last else "\n")
         
         return "\n".join(context_parts) if len(context_parts) > 1 else None
     
@@ -74,28 +106,23 @@ class ContextService:
         if not self.memories_dir.exists():
             return None
         
-        loaded_parts = []
-        not_found = []
+        # Opening each path decides whether it exists, so names may include
+        # subdirectories and follow the filesystem's case rules
+        contents = _read_many([self.memories_dir / f"{name}.md" for name in names])
         
-        for name in names:
-            file_path = self.memories_dir / f"{name}.md"
-            if file_path.exists():
-                try:
-                    content = file_path.read_text()
-                    loaded_parts.append(f"### MEMORY: {name}\n")
-                    loaded_parts.append(content)
-                    loaded_parts.append("\n")
-                except Exception:
-                    not_found.append(name)
-            else:
+        # One section per memory, joined once
+        sections = []
+        not_found = []
+        for name, content in zip(names, contents):
+            if content is None:
                 not_found.append(name)
+                continue
+            sections.append(f"### MEMORY: {name}\n{content}\n")
         
-        if not loaded_parts:
+        if not sections:
             return None
         
-        result = "## LOADED MEMORIES\n\n" + "\n---\n".join(
-            [part for part in "".join(loaded_parts).split("\n---\n") if part.strip()]
-        )
+        result = "## LOADED MEMORIES\n\n" + "\n---\n".join(sections)
         
         if not_found:
             result += f"\n\n⚠️ Not found: {', '.join(not_found)}"
@@ -139,40 +166,34 @@ class ContextService:
         # Collect all unique files from history
         files_set: set[str] = set()
         
-        with open(self.history_file, 'r') as f:
+        # Read raw bytes and only parse records that mention files_changed;
+        # json.loads decodes UTF-8 bytes itself
+        with open(self.history_file, 'rb') as f:
             for line in f:
-                line = line.strip()
-                if not line:
+                if b'"files_changed"' not in line:
                     continue
                 try:
                     task_data = json.loads(line)
-                    for file_path in task_data.get('files_changed', []):
-                        files_set.add(file_path)
-                except json.JSONDecodeError:
+                except ValueError:
+                    # Invalid JSON or invalid UTF-8
                     continue
+                files_set.update(task_data.get('files_changed', ()))
         
         if not files_set:
             return None
         
-        # Sort and format as tree
-        sorted_files = sorted(files_set)
+        # Split each path into (dir, "/", filename) once, in sorted order
+        pairs = [file_path.rpartition("/") for file_path in sorted(files_set)]
         
         # Group by directory for nicer output
-        tree_lines = []
-        current_dir = ""
-        for file_path in sorted_files:
-            parts = file_path.rsplit("/", 1)
-            if len(parts) == 2:
-                dir_path, filename = parts
-                if dir_path != current_dir:
-                    current_dir = dir_path
-                    tree_lines.append(f"{dir_path}/")
-                tree_lines.append(f"  {filename}")
-            else:
-                if current_dir != "":
-                    current_dir = ""
-                    tree_lines.append("./")
-                tree_lines.append(f"  {file_path}")
+        tree_lines: list[str] = []
+        for dir_path, group in groupby(pairs, key=itemgetter(0)):
+            # Top-level files get a "./" header unless they come first
+            if dir_path:
+                tree_lines.append(f"{dir_path}/")
+            elif tree_lines:
+                tree_lines.append("./")
+            tree_lines.extend("  " + pair[2] for pair in group)
         
         return "\n".join(tree_lines)
     
@@ -1,54 +1,79 @@
 """Epic service - CRUD operations for epics."""
 
+import io
 import re
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
 from ..db.models import Epic, Task, TaskStatus
-from ..utils.git import generate_epic_diff, generate_epic_files_changed
+from ..utils.git import format_files_changed, get_commit_diffs_batch, get_name_status_batch
+
+
+# \Z (not $) so a trailing newline is rejected
+_SLUG_RE = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*\Z')
 
 
 def is_valid_slug(name: str) -> bool:
     """Check if name is a valid slug (lowercase letters, numbers, and dashes only)."""
-    return bool(re.match(r'^[a-z0-9]+(-[a-z0-9]+)*$', name))
+    return _SLUG_RE.match(name) is not None
+
+
+@lru_cache(maxsize=256)
+def _format_day(ordinal: int) -> str:
+    """Format a proleptic Gregorian ordinal as e.g. "Jan 05" (tasks share days)."""
+    return date.fromordinal(ordinal).strftime("%b %d")
 
 
 class EpicService:
     def __init__(self, session: Session, moderails_dir: Optional[Path] = None):
         self.session = session
         self.moderails_dir = moderails_dir
+        # name -> Epic lookups (the identity map only keys by id). Epics are
+        # never deleted, but `epic update --name` renames them, so a hit is
+        # only used while the epic still has that name.
+        self._by_name: dict[str, Epic] = {}
     
     def create(self, name: str) -> Epic:
         """Create a new epic with a slug name (lowercase letters, numbers, and dashes only)."""
         if not is_valid_slug(name):
             raise ValueError("Epic name must be a slug (lowercase letters, numbers, and dashes only, e.g., 'my-epic')")
         
-        epic = Epic(name=name)
-        self.session.add(epic)
+        # INSERT ... RETURNING hands back the populated row - no refresh SELECT
+        epic = self.session.execute(insert(Epic).values(name=name).returning(Epic)).scalar_one()
         self.session.commit()
-        self.session.refresh(epic)
+        self._by_name[epic.name] = epic
         return epic
     
     def get(self, epic_id: str) -> Optional[Epic]:
-        return self.session.query(Epic).filter(Epic.id == epic_id).first()
+        # Primary-key lookup - served from the identity map when already loaded
+        return self.session.get(Epic, epic_id)
     
     def get_by_name(self, name: str) -> Optional[Epic]:
-        return self.session.query(Epic).filter(Epic.name == name).first()
+        epic = self._by_name.get(name)
+        if epic is not None and epic.name != name:
+            # Renamed since it was cached
+            del self._by_name[name]
+            epic = None
+        if epic is None:
+            epic = self.session.query(Epic).filter(Epic.name == name).first()
+            if epic is not None:
+                self._by_name[name] = epic
+        return epic
     
     def list_all(self) -> list[Epic]:
-        return self.session.query(Epic).all()
+        epics = self.session.query(Epic).all()
+        self._by_name.update((epic.name, epic) for epic in epics)
+        return epics
     
     def update(self, name: str) -> Optional[Epic]:
         """Update epic. Note: Epics are permanent containers and cannot be deleted."""
-        epic = self.get_by_name(name)
-        if not epic:
-            return None
-        # Epics only have name, nothing to update currently
-        self.session.commit()
-        self.session.refresh(epic)
-        return epic
+        # Epics only have name, nothing to update currently - no commit/refresh
+        return self.get_by_name(name)
     
     def get_summary(self, name: str, short: bool = False) -> str:
         """
@@ -62,47 +87,38 @@ class EpicService:
         if not epic:
             return ""
         
-        # Get completed tasks in order
-        tasks = (
-            self.session.query(Task)
-            .filter(Task.epic_id == epic.id, Task.status == TaskStatus.COMPLETED)
+        # Get completed tasks in order - only the columns the summary uses
+        rows = self.session.execute(
+            select(Task.name, Task.summary, Task.completed_at, Task.git_hash)
+            .where(Task.epic_id == epic.id, Task.status == TaskStatus.COMPLETED)
             .order_by(Task.completed_at)
-            .all()
-        )
+        ).all()
         
-        if not tasks:
+        if not rows:
             return f"# Epic: {epic.name}\n\nNo completed tasks yet."
         
-        # Build epic summary with per-task details
-        task_parts = []
+        # Fetch git data for all tasks up front (one git process) and render
+        # each commit's section once, so the task loop is only lookups
+        hashes = [row.git_hash.strip() for row in rows if row.git_hash and row.git_hash.strip()]
+        if short:
+            # Short format: file list with status (A/M/D/R)
+            label = "**Files**:"
+            bodies = {h: format_files_changed([out]) for h, out in get_name_status_batch(hashes).items()}
+        else:
+            # Full format: git diff only (includes filenames)
+            label = "**Diff**:"
+            bodies = get_commit_diffs_batch(hashes)
+        git_sections = {h: f"\n{label}\n{body}" for h, body in bodies.items() if body}
         
-        for idx, task in enumerate(tasks, 1):
-            parts = []
-            
-            # Task header with number and date
-            date_str = task.completed_at.strftime("%b %d") if task.completed_at else "unknown date"
-            parts.append(f"### {idx}. {task.name} ({date_str})\n")
-            parts.append(f"**Summary**: {task.summary}\n")
-            
-            # Show files or diff based on mode
-            if task.git_hash and task.git_hash.strip():
-                git_hash = task.git_hash.strip()
-                
-                if short:
-                    # Short format: file list with status (A/M/D/R)
-                    files_changed = generate_epic_files_changed([git_hash])
-                    if files_changed:
-                        parts.append("**Files**:")
-                        parts.append(files_changed)
-                else:
-                    # Full format: git diff only (includes filenames)
-                    task_diff = generate_epic_diff([git_hash])
-                    if task_diff:
-                        parts.append("**Diff**:")
-                        parts.append(task_diff)
-            
-            task_parts.append("\n".join(parts))
+        # Stream the summary into one buffer - no per-task list and no final
+        # join holding a second copy of every diff
+        buf = io.StringIO()
+        buf.write(f"# Epic: {epic.name}\n\n## Completed Tasks\n")
+        for idx, (task_name, summary, completed_at, git_hash) in enumerate(rows, 1):
+            if idx > 1:
+                buf.write("\n---\n\n")
+            date_str = _format_day(completed_at.toordinal()) if completed_at else "unknown date"
+            git_section = git_sections.get(git_hash.strip(), "") if git_hash else ""
+            buf.write(f"### {idx}. {task_name} ({date_str})\n\n**Summary**: {summary}\n{git_section}")
         
-        # Join with separators
-        header = f"# Epic: {epic.name}\n\n## Completed Tasks\n"
-        return header + "\n---\n\n".join(task_parts)
+        return buf.getvalue()
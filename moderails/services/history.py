@@ -1,21 +1,73 @@
 """History service - manages history.jsonl exports and imports."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from sqlalchemy import func, insert, or_, select
 from sqlalchemy.orm import Session
 
-from ..db.models import Task, TaskStatus, TaskType
+from ..db.models import Task, TaskStatus, TaskType, generate_task_id
 from ..utils.git import get_staged_files
 
 
+# GLOB pattern matching text with any non-ASCII character
+_NON_ASCII_GLOB = "*[^\x01-\x7f]*"
+
+
 class HistoryService:
     def __init__(self, session: Session, history_file: Path):
         self.session = session
         self.history_file = history_file
         self._last_mtime: Optional[float] = None
+        # ((st_mtime_ns, st_size), records) of the last parse of history_file
+        self._records_cache: Optional[tuple[tuple[int, int], list[dict]]] = None
+        # (records it was built from, ids of exported tasks)
+        self._ids_cache: Optional[tuple[list[dict], set[str]]] = None
+    
+    def _read_records(self) -> list[dict]:
+        """Parse history.jsonl, reusing the last parse while the file is unchanged.
+        
+        The cache is keyed on the file's (mtime, size), so every caller in this
+        service shares one read + parse per file version. Blank lines, invalid
+        JSON and non-object lines are skipped. Callers must not mutate the
+        returned records.
+        
+        Returns:
+            List of task records, or an empty list if the file doesn't exist
+        """
+        try:
+            st = os.stat(self.history_file)
+        except FileNotFoundError:
+            return []
+        
+        key = (st.st_mtime_ns, st.st_size)
+        if self._records_cache is not None and self._records_cache[0] == key:
+            return self._records_cache[1]
+        
+        records = []
+        with open(self.history_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    records.append(record)
+        
+        self._records_cache = (key, records)
+        return records
+    
+    def _exported_ids(self) -> set[str]:
+        """Ids of tasks already in history.jsonl (rebuilt only after a re-parse)."""
+        records = self._read_records()
+        if self._ids_cache is None or self._ids_cache[0] is not records:
+            self._ids_cache = (records, {r['id'] for r in records if r.get('id')})
+        return self._ids_cache[1]
     
     def sync_from_file(self) -> int:
         """Import completed tasks from history.jsonl to DB.
@@ -33,84 +85,98 @@ class HistoryService:
         if self._last_mtime is not None and current_mtime == self._last_mtime:
             return 0
         
-        imported_count = 0
+        # First pass: parse every record and collect the keys to check
+        records = []
+        ids: set[str] = set()
+        names: set[str] = set()
         
-        with open(self.history_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                task_data = json.loads(line)
-                task_id = task_data.get('id')
-                
-                # Check if task already exists (by id if available)
-                if task_id:
-                    existing_task = self.session.query(Task).filter(Task.id == task_id).first()
-                else:
-                    # Fallback to name for old history entries
-                    existing_task = self.session.query(Task).filter(Task.name == task_data['name']).first()
-                
-                if existing_task:
+        for task_data in self._read_records():
+            records.append(task_data)
+            if task_data.get('id'):
+                ids.add(task_data['id'])
+            else:
+                # Old history entries have no id - matched by name
+                names.add(task_data['name'])
+        
+        # Look up which records already exist with (at most) two queries
+        existing_ids: set[str] = set()
+        existing_names: set[str] = set()
+        if ids:
+            existing_ids = set(self.session.scalars(select(Task.id).where(Task.id.in_(ids))))
+        if names:
+            existing_names = set(self.session.scalars(select(Task.name).where(Task.name.in_(names))))
+        
+        # Second pass: build rows for the missing tasks and insert them together
+        new_rows = []
+        for task_data in records:
+            task_id = task_data.get('id')
+            task_name = task_data['name']
+            
+            # Check if task already exists (by id if available)
+            if task_id:
+                if task_id in existing_ids:
                     continue
-                
-                # Epic is not stored in history.jsonl (local only)
-                epic_id = None
-                
-                # Create task
-                task_name = task_data['name']
-                sanitized_name = task_name.lower().replace(' ', '-')
-                
-                # Get task type, default to FEATURE for old history entries
-                task_type = TaskType(task_data.get('type', 'feature'))
-                
-                task = Task(
-                    id=task_id if task_id else None,  # Will auto-generate if None
-                    name=task_name,
-                    file_name=f"{sanitized_name}.md",
-                    summary=task_data.get('summary', ''),
-                    type=task_type,
-                    status=TaskStatus.COMPLETED,
-                    completed_at=datetime.fromisoformat(task_data['completed_at']) if task_data.get('completed_at') else None,
-                    epic_id=epic_id,
-                )
-                self.session.add(task)
-                imported_count += 1
+            elif task_name in existing_names:
+                continue
+            
+            # Later duplicates in the same file are skipped too
+            if task_id:
+                existing_ids.add(task_id)
+            existing_names.add(task_name)
+            
+            # Create task
+            sanitized_name = task_name.lower().replace(' ', '-')
+            
+            # Get task type, default to FEATURE for old history entries
+            task_type = TaskType(task_data.get('type', 'feature'))
+            
+            # Epic is not stored in history.jsonl (local only), so epic_id stays NULL
+            new_rows.append({
+                # Every row carries an id so the executemany batch has uniform keys
+                "id": task_id or generate_task_id(),
+                "name": task_name,
+                "file_name": f"{sanitized_name}.md",
+                "summary": task_data.get('summary', ''),
+                "type": task_type,
+                "status": TaskStatus.COMPLETED,
+                "completed_at": datetime.fromisoformat(task_data['completed_at']) if task_data.get('completed_at') else None,
+            })
         
+        # Imported tasks aren't used as objects afterwards - a bulk INSERT skips
+        # building ORM instances and tracking them in the identity map
+        imported_count = len(new_rows)
         if imported_count > 0:
+            self.session.execute(insert(Task), new_rows)
             self.session.commit()
         
         self._last_mtime = current_mtime
         return imported_count
     
-    def export_task(self, task_id: str) -> None:
+    def export_task(self, task_id: str, files_changed: Optional[list[str]] = None) -> None:
         """Export completed task to history.jsonl.
         
         Appends task as a single line (JSON Lines format).
+        
+        Args:
+            task_id: 6-character task ID
+            files_changed: Staged files already looked up by the caller
+                (defaults to asking git for them)
         """
-        task = self.session.query(Task).filter(Task.id == task_id).first()
+        task = self.session.get(Task, task_id)
         if not task:
             raise ValueError(f"Task '{task_id}' not found")
         
         if task.status != TaskStatus.COMPLETED:
             raise ValueError(f"Task '{task_id}' is not completed")
         
-        # Check if task already exported (by reading existing lines)
-        if self.history_file.exists():
-            with open(self.history_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        existing_task = json.loads(line)
-                        if existing_task.get('id') == task.id:
-                            return  # Already exported
-                    except json.JSONDecodeError:
-                        continue
+        # Check if task already exported
+        exported_ids = self._exported_ids()
+        if task.id in exported_ids:
+            return  # Already exported
         
         # Get staged files (excludes _moderails/, lock files, etc.)
-        files_changed = get_staged_files()
+        if files_changed is None:
+            files_changed = get_staged_files()
         
         # Prepare task data (git_hash and epic_id stored only in local DB, not in shared history.jsonl)
         task_data = {
@@ -122,54 +188,64 @@ class HistoryService:
             "completed_at": task.completed_at.isoformat() if task.completed_at else None,
         }
         
-        # Append as single line (JSON Lines format)
-        with open(self.history_file, 'a') as f:
-            f.write(json.dumps(task_data) + '\n')
+        # Append as single line (JSON Lines format). One write() on an
+        # O_APPEND descriptor, so concurrent exports can't interleave lines
+        payload = (json.dumps(task_data) + '\n').encode()
+        fd = os.open(self.history_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        
+        st = os.stat(self.history_file)
+        self._last_mtime = st.st_mtime
         
-        self._last_mtime = self.history_file.stat().st_mtime
+        # Extend the cached parse with our own line instead of re-reading the
+        # file - unless someone else appended too (size doesn't add up)
+        cached = self._records_cache
+        previous_size = cached[0][1] if cached is not None else 0
+        if cached is not None and st.st_size == previous_size + len(payload):
+            cached[1].append(task_data)
+            exported_ids.add(task.id)
+            self._records_cache = ((st.st_mtime_ns, st.st_size), cached[1])
     
     def search_by_file(self, file_path: str) -> list[dict]:
         """Search tasks (all statuses) that touched this file."""
-        # Search in DB
-        tasks = self.session.query(Task).all()
+        # Search in DB - by summary/file name containing the file path.
+        # instr() is a case-sensitive substring test, like Python's `in`
+        tasks = self.session.query(Task).filter(or_(
+            func.instr(Task.summary, file_path) > 0,
+            func.instr(Task.file_name, file_path) > 0,
+        )).all()
         results = []
         
         for task in tasks:
-            # Check if file is in files_changed (from history.jsonl or git_hash)
-            # For now, we'll search by summary/name containing the file path
-            if file_path in task.summary or file_path in task.file_name:
-                results.append({
-                    "name": task.name,
-                    "status": task.status.value,
-                    "epic": task.epic.name if task.epic else None,
-                    "summary": task.summary,
-                    "git_hash": task.git_hash,
-                    "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-                })
+            results.append({
+                "name": task.name,
+                "status": task.status.value,
+                "epic": task.epic.name if task.epic else None,
+                "summary": task.summary,
+                "git_hash": task.git_hash,
+                "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+            })
         
         # Also search history.jsonl for files_changed field (JSON Lines format)
-        if self.history_file.exists():
-            with open(self.history_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        task_data = json.loads(line)
-                        if file_path in task_data.get('files_changed', []):
-                            # Check if not already in results
-                            if not any(r['name'] == task_data['name'] for r in results):
-                                results.append({
-                                    "name": task_data['name'],
-                                    "status": "completed",
-                                    "epic": task_data.get('epic'),
-                                    "summary": task_data.get('summary', ''),
-                                    "git_hash": task_data.get('git_hash', ''),
-                                    "completed_at": task_data.get('completed_at'),
-                                    "files_changed": task_data.get('files_changed', []),
-                                })
-                    except json.JSONDecodeError:
-                        continue
+        seen_names = {r['name'] for r in results}
+        for task_data in self._read_records():
+            if file_path in task_data.get('files_changed', []):
+                # Check if not already in results
+                if task_data['name'] not in seen_names:
+                    seen_names.add(task_data['name'])
+                    results.append({
+                        "name": task_data['name'],
+                        "status": "completed",
+                        "epic": task_data.get('epic'),
+                        "summary": task_data.get('summary', ''),
+                        "git_hash": task_data.get('git_hash', ''),
+                        "completed_at": task_data.get('completed_at'),
+                        # Copy - the parsed records are cached
+                        "files_changed": list(task_data.get('files_changed', [])),
+                    })
         
         return results
     
@@ -179,25 +255,39 @@ class HistoryService:
         Supports OR search with multiple terms separated by | (pipe).
         Example: "auth|user" matches tasks containing "auth" OR "user"
         """
-        # Split query by | for OR search
-        query_terms = [term.strip().lower() for term in query.split('|')]
-        tasks = self.session.query(Task).all()
+        # Split query by | for OR search (repeated terms only need one test)
+        query_terms = list(dict.fromkeys(term.strip().lower() for term in query.split('|')))
+        
+        # SQL only narrows the rows down: SQLite's lower() folds ASCII letters
+        # only, so it matches ASCII terms against each lowercased field and
+        # passes every row with non-ASCII text through
+        name_lower = func.lower(Task.name)
+        summary_lower = func.lower(func.coalesce(Task.summary, ""))
+        tasks = self.session.query(Task).filter(or_(
+            *(
+                or_(func.instr(name_lower, term) > 0, func.instr(summary_lower, term) > 0)
+                for term in query_terms if term.isascii()
+            ),
+            Task.name.op("GLOB")(_NON_ASCII_GLOB),
+            Task.summary.op("GLOB")(_NON_ASCII_GLOB),
+        )).all()
         results = []
         
         for task in tasks:
+            # Exact match with Python's full Unicode lower() (OR logic)
             task_name_lower = task.name.lower()
-            task_summary_lower = task.summary.lower()
+            task_summary_lower = (task.summary or "").lower()
+            if not any(term in task_name_lower or term in task_summary_lower for term in query_terms):
+                continue
             
-            # Check if any query term matches (OR logic)
-            if any(term in task_name_lower or term in task_summary_lower for term in query_terms):
-                results.append({
-                    "name": task.name,
-                    "status": task.status.value,
-                    "epic": task.epic.name if task.epic else None,
-                    "summary": task.summary,
-                    "git_hash": task.git_hash,
-                    "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-                })
+            results.append({
+                "name": task.name,
+                "status": task.status.value,
+                "epic": task.epic.name if task.epic else None,
+                "summary": task.summary,
+                "git_hash": task.git_hash,
+                "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+            })
         
         return results
 
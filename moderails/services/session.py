@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Any, Optional
 
-from sqlalchemy.orm import Session as DBSession
+from sqlalchemy.orm import Session as DBSession, contains_eager
 
 from ..db.models import Session, Task, TaskStatus
 
@@ -25,18 +25,15 @@ class SessionService:
         Returns:
             Active session or None if no in-progress task
         """
-        # Find the in-progress task
-        task = self.db_session.query(Task).filter(
-            Task.status == TaskStatus.IN_PROGRESS
-        ).first()
-        
-        if not task:
-            return None
-        
-        # Find its session
-        return self.db_session.query(Session).filter(
-            Session.task_id == task.id
-        ).first()
+        # Session of the in-progress task in one query; the joined task row
+        # also populates session.task so callers don't lazy-load it
+        return (
+            self.db_session.query(Session)
+            .join(Session.task)
+            .filter(Task.status == TaskStatus.IN_PROGRESS)
+            .options(contains_eager(Session.task))
+            .first()
+        )
     
     def ensure_active(self, task_id: str) -> Session:
         """Ensure a session exists for the given task, creating if needed.
@@ -67,7 +64,6 @@ class SessionService:
         session = Session(task_id=task_id, current_mode="start")
         self.db_session.add(session)
         self.db_session.commit()
-        self.db_session.refresh(session)
         return session
     
     def set_mode(self, mode: str) -> Optional[Session]:
@@ -83,9 +79,9 @@ class SessionService:
         if not session:
             return None
         
+        # updated_at comes back via RETURNING - no refresh needed
         session.current_mode = mode
         self.db_session.commit()
-        self.db_session.refresh(session)
         return session
     
     def add_memory(self, memory_name: str) -> bool:
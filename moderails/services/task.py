@@ -4,21 +4,41 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from ..db.models import Epic, Session as SessionModel, Task, TaskStatus, TaskType
 from ..modes import get_task_template
 
 DESCRIPTION_MAX_LENGTH = 500
 
+# Characters replaced with dashes in file/folder names
+_SANITIZE_TABLE = str.maketrans({" ": "-", "/": "-"})
+
+_UTC = timezone.utc
+
+
+def _utc_now() -> datetime:
+    """Current UTC time as the naive datetime a DateTime column loads back.
+    
+    Lets callers keep using an instance after commit without refresh() -
+    the in-memory value is what a reload from SQLite would return.
+    """
+    return datetime.now(_UTC).replace(tzinfo=None)
+
 
 class TaskService:
     def __init__(self, session: Session, moderails_dir: Path):
         self.session = session
         self.moderails_dir = moderails_dir
+        # Task folders already created by this service - skips repeat mkdir stats
+        self._ensured_dirs: set[Path] = set()
     
     def _sanitize_name(self, name: str) -> str:
-        return name.lower().replace(" ", "-").replace("/", "-")
+        return name.lower().translate(_SANITIZE_TABLE)
+    
+    def _epic_exists(self, epic_id: str) -> bool:
+        # Select only the key - no Epic row is hydrated just to validate it
+        return self.session.query(Epic.id).filter(Epic.id == epic_id).scalar() is not None
     
     def create(
         self,
@@ -52,7 +72,7 @@ class TaskService:
         
         # Enforce single in-progress task when creating as in-progress
         if status == TaskStatus.IN_PROGRESS:
-            existing = self.session.query(Task).filter(
+            existing = self.session.query(Task.id, Task.name).filter(
                 Task.status == TaskStatus.IN_PROGRESS
             ).first()
             if existing:
@@ -62,11 +82,8 @@ class TaskService:
                 )
         
         # Validate epic if provided
-        epic = None
-        if epic_id:
-            epic = self.session.query(Epic).filter(Epic.id == epic_id).first()
-            if not epic:
-                raise ValueError(f"Epic with ID '{epic_id}' not found")
+        if epic_id and not self._epic_exists(epic_id):
+            raise ValueError(f"Epic with ID '{epic_id}' not found")
         
         # Create task - file_name stays empty until plan mode
         task = Task(
@@ -78,9 +95,9 @@ class TaskService:
             epic_id=epic_id,
             status=status,
         )
+        # created_at comes back from the INSERT (eager_defaults) - no refresh needed
         self.session.add(task)
         self.session.commit()
-        self.session.refresh(task)
         return task
     
     def create_plan_file(self, task_id: str) -> Optional[str]:
@@ -109,8 +126,10 @@ class TaskService:
             tasks_dir = self.moderails_dir / "tasks"
             file_name = f"tasks/{filename_base}"
         
-        # Create directory and file
-        tasks_dir.mkdir(parents=True, exist_ok=True)
+        # Create directory (once per folder) and file
+        if tasks_dir not in self._ensured_dirs:
+            tasks_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(tasks_dir)
         task_file = tasks_dir / filename_base
         
         template = get_task_template()
@@ -125,7 +144,8 @@ class TaskService:
     
     def get(self, task_id: str) -> Optional[Task]:
         """Get task by 6-character task ID."""
-        return self.session.query(Task).filter(Task.id == task_id).first()
+        # Primary-key lookup - served from the identity map when already loaded
+        return self.session.get(Task, task_id)
     
     def get_by_name(self, name: str) -> Optional[Task]:
         """Get task by name (for backwards compatibility)."""
@@ -134,14 +154,31 @@ class TaskService:
     def list_all(self, epic_name: Optional[str] = None, status: Optional[TaskStatus] = None) -> list[Task]:
         query = self.session.query(Task)
         if epic_name:
-            epic = self.session.query(Epic).filter(Epic.name == epic_name).first()
-            if not epic:
+            epic_id = self.session.query(Epic.id).filter(Epic.name == epic_name).scalar()
+            if epic_id is None:
                 return []  # Epic not found, return empty list
-            query = query.filter(Task.epic_id == epic.id)
+            query = query.filter(Task.epic_id == epic_id)
         if status:
             query = query.filter(Task.status == status)
         return query.all()
     
+    def list_by_statuses(self, statuses: list[TaskStatus]) -> list[Task]:
+        """List tasks in any of the given statuses with one query.
+        
+        Lets callers that need several status groups partition a single result
+        instead of calling list_all() once per status.
+        
+        Only the columns used for task listings (id, name, status, type,
+        file_name, epic) are selected; other attributes such as summary or
+        description are loaded on first access.
+        """
+        return (
+            self.session.query(Task)
+            .options(load_only(Task.id, Task.name, Task.status, Task.type, Task.file_name, Task.epic_id))
+            .filter(Task.status.in_(statuses))
+            .all()
+        )
+    
     def update(
         self,
         task_id: str,
@@ -160,7 +197,7 @@ class TaskService:
         
         # Enforce single in-progress task
         if status == TaskStatus.IN_PROGRESS:
-            existing = self.session.query(Task).filter(
+            existing = self.session.query(Task.id, Task.name).filter(
                 Task.status == TaskStatus.IN_PROGRESS,
                 Task.id != task_id
             ).first()
@@ -175,7 +212,7 @@ class TaskService:
         if status:
             task.status = status
             if status == TaskStatus.COMPLETED:
-                task.completed_at = datetime.now(timezone.utc)
+                task.completed_at = _utc_now()
         if task_type is not None:
             task.type = task_type
         if summary is not None:
@@ -191,14 +228,19 @@ class TaskService:
         if file_name is not None:
             task.file_name = file_name
         if epic_id != "__unset__":
-            if epic_id is not None:
-                epic = self.session.query(Epic).filter(Epic.id == epic_id).first()
-                if not epic:
-                    raise ValueError(f"Epic with ID '{epic_id}' not found")
-            task.epic_id = epic_id
+            if epic_id is not None and not self._epic_exists(epic_id):
+                raise ValueError(f"Epic with ID '{epic_id}' not found")
+            if epic_id != task.epic_id:
+                task.epic_id = epic_id
+                # Setting the FK doesn't move an already-loaded relationship
+                self.session.expire(task, ["epic"])
+        
+        # Nothing changed (no arguments, or same values) - skip the commit
+        if not self.session.is_modified(task):
+            return task
         
+        # Every changed column was set here, so the instance is already current
         self.session.commit()
-        self.session.refresh(task)
         return task
     
     def delete(self, task_id: str) -> bool:
@@ -208,9 +250,7 @@ class TaskService:
         
         # Delete task file if it exists
         if task.file_name:
-            task_file = self.moderails_dir / task.file_name
-            if task_file.exists():
-                task_file.unlink()
+            (self.moderails_dir / task.file_name).unlink(missing_ok=True)
         
         # Delete associated session first to avoid FK constraint violation
         task_session = self.session.query(SessionModel).filter(
@@ -228,10 +268,13 @@ class TaskService:
         if not task:
             return None
         
-        # Task file is directly in _moderails/
+        # Task file is directly in _moderails/ - just try the read, a missing
+        # file costs no more than an exists() check would
         task_file = self.moderails_dir / task.file_name
-        
-        return task_file.read_text() if task_file.exists() else None
+        try:
+            return task_file.read_text()
+        except FileNotFoundError:
+            return None
     
     def complete(self, task_id: str, git_hash: Optional[str] = None) -> Task:
         """Mark task as completed and export to history.jsonl.
@@ -252,12 +295,9 @@ class TaskService:
         
         # Update task
         task.status = TaskStatus.COMPLETED
-        task.completed_at = datetime.now(timezone.utc)
+        task.completed_at = _utc_now()
         if git_hash:
             task.git_hash = git_hash
         
         self.session.commit()
-        self.session.refresh(task)
-        
-        
         return task
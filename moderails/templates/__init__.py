@@ -1,9 +1,16 @@
 """Templates for moderails initialization."""
 
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
 def get_template_path(template_name: str) -> Path:
     """Get the path to a template file."""
     return Path(__file__).parent / template_name
 
+
+@lru_cache(maxsize=8)
+def read_template_bytes(template_name: str) -> bytes:
+    """Read a template file once per process (templates ship with the package)."""
+    return get_template_path(template_name).read_bytes()
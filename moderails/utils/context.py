@@ -1,18 +1,24 @@
 """Context builder for dynamic mode templates."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from ..config import is_private_mode
+from ..config import MODERAILS_DIR, is_private_mode
 from ..db.database import find_db_path
 from ..db.models import Task, TaskStatus
 from ..modes import get_mode
-from .git import get_current_branch, get_staged_files, get_unstaged_files, is_git_repo
+from .git import get_worktree_state
 
 
+@lru_cache(maxsize=1)
 def load_protocol_partial() -> str:
     """Load the shared protocol partial.
     
+    Read once per process - the file ships with the package.
+    
     Returns:
         Content of the protocol.md partial, or empty string if not found
     """
@@ -22,16 +28,30 @@ def load_protocol_partial() -> str:
     return ""
 
 
+# Project roots found per working directory. Misses aren't cached, so a
+# database created later in the process is still picked up.
+_project_roots: dict[str, Path] = {}
+
+
 def get_project_root() -> Optional[Path]:
     """Get the project root directory (parent of _moderails).
     
+    Found roots are cached per working directory, so repeated mode builds
+    skip the path resolution and database stat.
+    
     Returns:
         Absolute path to project root, or None if no moderails found
     """
-    db_path = find_db_path()
+    cwd = os.getcwd()
+    project_root = _project_roots.get(cwd)
+    if project_root is not None:
+        return project_root
+    
+    db_path = find_db_path(Path(cwd))
     if db_path:
         # db is at _moderails/moderails.db, so parent.parent is project root
-        return db_path.parent.parent
+        project_root = _project_roots[cwd] = db_path.parent.parent
+        return project_root
     return None
 
 
@@ -55,6 +75,11 @@ def get_draft_tasks(services: dict) -> list[dict]:
     return [_task_to_dict(t) for t in tasks]
 
 
+def _task_file_path(file_name: str) -> str:
+    """Project-relative path of a task plan file."""
+    return f"{MODERAILS_DIR}/{file_name}"
+
+
 def _task_to_dict(task: Task) -> dict:
     """Convert Task model to dict for template rendering."""
     has_plan_file = bool(task.file_name)
@@ -63,7 +88,7 @@ def _task_to_dict(task: Task) -> dict:
         "name": task.name,
         "status": task.status.value,
         "file_name": task.file_name,
-        "file_path": f"_moderails/{task.file_name}" if task.file_name else None,
+        "file_path": _task_file_path(task.file_name) if task.file_name else None,
         "has_plan_file": has_plan_file,
         "type": task.type.value,
         "epic": {
@@ -73,6 +98,108 @@ def _task_to_dict(task: Task) -> dict:
     }
 
 
+def _add_current_task(services: dict, context: dict[str, Any]) -> None:
+    """Task-aware modes - need current in-progress task only."""
+    context["current_task"] = get_in_progress_task(services)
+
+
+def _build_start_context(services: dict, context: dict[str, Any]) -> None:
+    """Start mode - needs in-progress task, draft tasks, epics, and skills."""
+    # In-progress and draft tasks from one query, split by status
+    tasks = services["task"].list_by_statuses([TaskStatus.IN_PROGRESS, TaskStatus.DRAFT])
+    current = next((t for t in tasks if t.status == TaskStatus.IN_PROGRESS), None)
+    context["current_task"] = _task_to_dict(current) if current else None
+    context["draft_tasks"] = [_task_to_dict(t) for t in tasks if t.status == TaskStatus.DRAFT]
+    epics = services["epic"].list_all()
+    context["epics"] = [{"id": e.id, "name": e.name} for e in epics]
+    context["skills"] = services["context"].list_skills()
+
+
+def _build_plan_context(services: dict, context: dict[str, Any]) -> None:
+    """Plan mode: current task, auto-creating its plan file if it doesn't exist."""
+    _add_current_task(services, context)
+    task_dict = context["current_task"]
+    if task_dict and not task_dict.get("has_plan_file"):
+        # Create plan file - only the file fields change, so update the
+        # dict in place instead of re-fetching the task
+        file_name = services["task"].create_plan_file(task_dict["id"])
+        if file_name:
+            task_dict["file_name"] = file_name
+            task_dict["file_path"] = _task_file_path(file_name)
+            task_dict["has_plan_file"] = True
+
+
+def _build_complete_context(services: dict, context: dict[str, Any]) -> None:
+    """Complete mode: current task plus git state and private mode."""
+    _add_current_task(services, context)
+    # One `git status` instead of separate repo/branch/staged/unstaged calls
+    state = get_worktree_state()
+    branch = state["branch"] if state else None
+    context["git"] = {
+        "is_repo": state is not None,
+        "branch": branch,
+        "is_main": branch == "main" if branch else False,
+        "staged_files": state["staged_files"] if state else [],
+        "unstaged_files": state["unstaged_files"] if state else [],
+    }
+    context["private"] = is_private_mode()
+
+
+def _build_discovery_context(
+    services: dict,
+    context: dict[str, Any],
+    foreground: Optional[Callable[[], None]] = None,
+) -> None:
+    """Full context discovery - mandatory context, memories and files tree.
+    
+    The three loaders only touch files, so two run in the background while
+    this thread builds the files tree and then runs foreground (DB work stays
+    on the session's thread).
+    """
+    context_service = services["context"]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        mandatory_future = executor.submit(context_service.load_mandatory_context)
+        memories_future = executor.submit(context_service.list_memories)
+        
+        context["files_tree"] = context_service.get_files_tree()
+        if foreground is not None:
+            foreground()
+        
+        context["mandatory_context"] = mandatory_future.result()
+        context["memories"] = memories_future.result()
+
+
+def _build_fast_context(services: dict, context: dict[str, Any]) -> None:
+    """Fast mode: full context discovery only."""
+    _build_discovery_context(services, context)
+
+
+def _build_research_context(services: dict, context: dict[str, Any]) -> None:
+    """Research mode: full discovery plus current in-progress task and epic context."""
+    def add_task_context() -> None:
+        task = get_in_progress_task(services)
+        context["current_task"] = task
+        # Only load epic context for in-progress tasks
+        if task and task.get("epic"):
+            epic_summary = services["epic"].get_summary(task["epic"]["name"])
+            context["epic_context"] = epic_summary
+    
+    _build_discovery_context(services, context, foreground=add_task_context)
+
+
+# Per-mode context builders; modes not listed only get flags and project root
+_MODE_BUILDERS: dict[str, Callable[[dict, dict[str, Any]], None]] = {
+    "start": _build_start_context,
+    "research": _build_research_context,
+    "fast": _build_fast_context,
+    "brainstorm": _add_current_task,
+    "plan": _build_plan_context,
+    "execute": _add_current_task,
+    "complete": _build_complete_context,
+    "abort": _add_current_task,
+}
+
+
 def build_mode_context(
     services: dict,
     mode_name: str,
@@ -99,53 +226,9 @@ def build_mode_context(
     project_root = get_project_root()
     context["project_root"] = str(project_root) if project_root else None
     
-    # Start mode - needs in-progress task, draft tasks, epics, and skills
-    if mode_name == "start":
-        context["current_task"] = get_in_progress_task(services)
-        context["draft_tasks"] = get_draft_tasks(services)
-        epics = services["epic"].list_all()
-        context["epics"] = [{"id": e.id, "name": e.name} for e in epics]
-        context["skills"] = services["context"].list_skills()
-    
-    # Task-aware modes - need current in-progress task only
-    if mode_name in ("execute", "complete", "plan", "brainstorm", "abort"):
-        context["current_task"] = get_in_progress_task(services)
-    
-    # Plan mode: auto-create plan file if it doesn't exist
-    if mode_name == "plan" and context.get("current_task"):
-        task_dict = context["current_task"]
-        if not task_dict.get("has_plan_file"):
-            # Create plan file and re-fetch task to get updated file info
-            services["task"].create_plan_file(task_dict["id"])
-            context["current_task"] = get_in_progress_task(services)
-    
-    # Git state and private mode - only complete mode needs this
-    if mode_name == "complete":
-        in_git_repo = is_git_repo()
-        branch = get_current_branch() if in_git_repo else None
-        context["git"] = {
-            "is_repo": in_git_repo,
-            "branch": branch,
-            "is_main": branch == "main" if branch else False,
-            "staged_files": get_staged_files() if in_git_repo else [],
-            "unstaged_files": get_unstaged_files() if in_git_repo else [],
-        }
-        context["private"] = is_private_mode()
-    
-    # Full context discovery - research and fast modes
-    if mode_name in ("research", "fast"):
-        context["mandatory_context"] = services["context"].load_mandatory_context()
-        context["memories"] = services["context"].list_memories()
-        context["files_tree"] = services["context"].get_files_tree()
-    
-    # Research mode also needs current in-progress task and epic context
-    if mode_name == "research":
-        task = get_in_progress_task(services)
-        context["current_task"] = task
-        # Only load epic context for in-progress tasks
-        if task and task.get("epic"):
-            epic_summary = services["epic"].get_summary(task["epic"]["name"])
-            context["epic_context"] = epic_summary
+    builder = _MODE_BUILDERS.get(mode_name)
+    if builder is not None:
+        builder(services, context)
     
     return context
 
@@ -162,7 +245,18 @@ def build_rerail_context(services: dict, task, project_root) -> str:
         Formatted session context string
     """
     epic = task.epic if task else None
-    active_session = services["session"].get_active()
+    
+    # The protocol partial and mandatory context are plain file reads - run
+    # them in the background while this thread does the DB work and plan read
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        protocol_future = executor.submit(load_protocol_partial)
+        mandatory_future = executor.submit(services["context"].load_mandatory_context)
+        
+        active_session = services["session"].get_active()
+        task_content = services["task"].get_task_content(task.id) if task.file_name else None
+        
+        protocol_content = protocol_future.result()
+        mandatory_content = mandatory_future.result()
     
     output = []
     
@@ -180,14 +274,12 @@ def build_rerail_context(services: dict, task, project_root) -> str:
     output.append("---\n")
     
     # Protocol rules (from partial)
-    protocol_content = load_protocol_partial()
     if protocol_content:
         output.append(protocol_content)
         output.append("")
         output.append("---\n")
     
     # Mandatory context
-    mandatory_content = services["context"].load_mandatory_context()
     if mandatory_content:
         output.append(mandatory_content)
         output.append("")
@@ -204,14 +296,12 @@ def build_rerail_context(services: dict, task, project_root) -> str:
             output.append("---\n")
     
     # Task plan
-    if task.file_name:
-        task_content = services["task"].get_task_content(task.id)
-        if task_content:
-            output.append("## Task Plan\n")
-            output.append(f"File: `_moderails/{task.file_name}`\n")
-            output.append(task_content)
-            output.append("")
-            output.append("---\n")
+    if task_content:
+        output.append("## Task Plan\n")
+        output.append(f"File: `{_task_file_path(task.file_name)}`\n")
+        output.append(task_content)
+        output.append("")
+        output.append("---\n")
     
     # Current mode instructions (skip for "start" - protocol already loaded above)
     mode = active_session.current_mode
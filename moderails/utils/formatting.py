@@ -1,10 +1,24 @@
 """Formatting utilities for CLI output."""
 
+from datetime import date
+from functools import lru_cache
 from typing import Tuple
 import click
 from ..db.models import Task, TaskStatus
 
 
+# (status_color, task_id_color, type_color, epic_color, timestamp_color, name_color)
+_COMPLETED_COLORS = ("green", "bright_black", "bright_black", "cyan", "white", "bright_black")
+_IN_PROGRESS_COLORS = ("bright_yellow", "white", "green", "cyan", "white", "white")
+_DRAFT_COLORS = ("blue", "white", "green", "cyan", "white", "white")
+
+_TASK_COLORS = {
+    TaskStatus.COMPLETED: _COMPLETED_COLORS,
+    TaskStatus.IN_PROGRESS: _IN_PROGRESS_COLORS,
+    TaskStatus.DRAFT: _DRAFT_COLORS,
+}
+
+
 def get_task_colors(status: TaskStatus) -> Tuple[str, str, str, str, str, str]:
     """
     Get colors for task display based on status.
@@ -12,12 +26,19 @@ def get_task_colors(status: TaskStatus) -> Tuple[str, str, str, str, str, str]:
     Returns:
         (status_color, task_id_color, type_color, epic_color, timestamp_color, name_color)
     """
-    if status == TaskStatus.COMPLETED:
-        return ("green", "bright_black", "bright_black", "cyan", "white", "bright_black")
-    elif status == TaskStatus.IN_PROGRESS:
-        return ("bright_yellow", "white", "green", "cyan", "white", "white")
-    else:  # DRAFT
-        return ("blue", "white", "green", "cyan", "white", "white")
+    return _TASK_COLORS.get(status, _DRAFT_COLORS)
+
+
+@lru_cache(maxsize=1024)
+def _format_minute(ordinal: int, hour: int, minute: int) -> str:
+    """Format a day ordinal and time as "[YYYY-MM-DD HH:MM]" (tasks share minutes)."""
+    return date.fromordinal(ordinal).strftime(f"[%Y-%m-%d {hour:02d}:{minute:02d}]")
+
+
+@lru_cache(maxsize=512)
+def _style_label(text: str, fg: str) -> str:
+    """click.style() for labels that repeat across rows (type, status, epic)."""
+    return click.style(text, fg=fg)
 
 
 def format_task_line(task: Task) -> str:
@@ -34,20 +55,21 @@ def format_task_line(task: Task) -> str:
     line_parts.append(click.style(task.id, fg=task_id_color))
     
     # Type in brackets
-    line_parts.append(click.style(f"[{task.type.value}]", fg=type_color))
+    line_parts.append(_style_label(f"[{task.type.value}]", type_color))
     
     # Status in brackets
-    line_parts.append(click.style(f"[{task.status.value}]", fg=status_color))
+    line_parts.append(_style_label(f"[{task.status.value}]", status_color))
     
     # Epic (if any) in brackets
     if task.epic:
-        line_parts.append(click.style(f"[{task.epic.name}]", fg=epic_color))
+        line_parts.append(_style_label(f"[{task.epic.name}]", epic_color))
     
     # Timestamp
     if task.status == TaskStatus.COMPLETED and task.completed_at:
-        timestamp = task.completed_at.strftime("[%Y-%m-%d %H:%M]")
+        ts = task.completed_at
     else:
-        timestamp = task.created_at.strftime("[%Y-%m-%d %H:%M]")
+        ts = task.created_at
+    timestamp = _format_minute(ts.toordinal(), ts.hour, ts.minute)
     line_parts.append(click.style(timestamp, fg=timestamp_color))
     
     # Dash separator
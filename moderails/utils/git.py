@@ -1,17 +1,78 @@
 """Git utilities for generating LLM-optimized commit diffs."""
 
+import os
+import re
+import string
 import subprocess
-from typing import Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
 
+_T = TypeVar("_T")
 
-def _run_git(args: list[str], cwd: str = ".") -> Optional[str]:
-    """Run git command and return output, or None on error."""
+# Every `git show` skips ref decorations: none of the formats print them, and
+# a log.decorate setting would otherwise have git load every ref up front
+_SHOW = ["show", "--no-decorate"]
+
+# Patterns to exclude from files_changed in history
+EXCLUDED_PATTERNS = [
+    "_moderails/",
+    "poetry.lock",
+    "package-lock.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "Gemfile.lock",
+    "Cargo.lock",
+    "composer.lock",
+    "go.sum",
+]
+
+# Prefix written before each commit's header in batched `git show` output
+# (argv can't contain NUL, so git is asked for it via the %x00 placeholder)
+_COMMIT_MARKER = "\x00"
+_COMMIT_MARKER_FORMAT = "%x00"
+
+# `git show` header and options for commit diffs: the raw listing carries
+# the name-status, so one call serves both diffs and file lists
+_BUNDLE_HEADER = "%H%n%s"
+_BUNDLE_ARGS = ["--patch-with-raw", "--unified=0", "-M", "-C"]
+
+# A line starting a commit or a file diff in `git show` output
+_SECTION_START = re.compile(r"^(?:\x00|diff --git )", re.M)
+
+# Characters read from git at a time while streaming its output
+_READ_SIZE = 1 << 16
+
+# Start of a file's diff, and of its first hunk
+_FILE_DIFF_START = re.compile(r"^diff --git ", re.M)
+_HUNK_START = re.compile(r"^@@", re.M)
+
+# Per-commit results of the show helpers, keyed by (kind, repo dir, hash).
+# Commit ids are content-addressed, so cached entries never go stale.
+SHOW_CACHE_SIZE = 512
+_show_cache: "OrderedDict[tuple[str, str, str], Any]" = OrderedDict()
+# Per-commit fallbacks run on worker threads (see _map_commits)
+_show_cache_lock = threading.Lock()
+
+# Upper bound on concurrent per-commit git processes
+MAX_GIT_WORKERS = 8
+
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+
+def _run_git(args: list[str], cwd: str = ".", input: Optional[str] = None) -> Optional[str]:
+    """Run git command (optionally feeding input to stdin) and return output, or None on error."""
     try:
         result = subprocess.run(
             ["git", "-C", cwd] + args,
+            input=input,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            # Diffs of non-UTF-8 files must not fail the whole call
+            errors="replace",
             check=False,
         )
         if result.returncode != 0:
@@ -26,20 +87,6 @@ def is_git_repo(cwd: str = ".") -> bool:
     return _run_git(["rev-parse", "--is-inside-work-tree"], cwd) is not None
 
 
-# Patterns to exclude from files_changed in history
-EXCLUDED_PATTERNS = [
-    "_moderails/",
-    "poetry.lock",
-    "package-lock.json",
-    "yarn.lock",
-    "pnpm-lock.yaml",
-    "Gemfile.lock",
-    "Cargo.lock",
-    "composer.lock",
-    "go.sum",
-]
-
-
 def get_staged_files(cwd: str = ".") -> list[str]:
     """
     Get list of staged files, excluding irrelevant patterns.
@@ -113,6 +160,72 @@ def get_unstaged_files(cwd: str = ".") -> list[str]:
     return files
 
 
+def get_worktree_state(cwd: str = ".") -> Optional[dict]:
+    """
+    Get branch, staged and unstaged files with a single git process.
+    
+    Same results as is_git_repo(), get_current_branch(), get_staged_files()
+    and get_unstaged_files() combined, but parsed from one
+    `git status --porcelain=v2 --branch` call instead of four processes.
+    
+    Returns:
+        Dict with "branch", "staged_files" and "unstaged_files",
+        or None if not inside a git repository
+    """
+    # Untracked files are not reported by the diff-based helpers either;
+    # --no-optional-locks keeps status from rewriting the index, and paths
+    # stay repo-relative like `git diff --name-only` from a subdirectory
+    output = _run_git(
+        [
+            "--no-optional-locks", "-c", "status.relativePaths=false",
+            "status", "--porcelain=v2", "--branch", "--untracked-files=no",
+        ],
+        cwd
+    )
+    if output is None:
+        return None
+    
+    branch = None
+    staged: list[str] = []
+    unstaged: list[str] = []
+    
+    for line in output.splitlines():
+        kind = line[:1]
+        if kind == "#":
+            if line.startswith("# branch.head "):
+                head = line[len("# branch.head "):]
+                branch = None if head == "(detached)" else head
+            continue
+        
+        # Fields before the path: 8 for changed entries, 9 for renames/copies
+        # (path<TAB>original path), 10 for unmerged entries
+        if kind == "1":
+            fields = line.split(" ", 8)
+        elif kind == "2":
+            fields = line.split(" ", 9)
+        elif kind == "u":
+            fields = line.split(" ", 10)
+        else:
+            continue
+        
+        path = fields[-1].split("\t", 1)[0]
+        if any(pattern in path for pattern in EXCLUDED_PATTERNS):
+            continue
+        
+        # XY: index and worktree status, "." when unchanged
+        xy = fields[1]
+        if kind == "u" or xy[0] != ".":
+            staged.append(path)
+        if kind == "u" or xy[1] != ".":
+            unstaged.append(path)
+    
+    return {
+        "branch": branch,
+        "staged_files": sorted(staged),
+        "unstaged_files": sorted(unstaged),
+    }
+
+
 def get_commit_meta(hash: str, cwd: str = ".") -> tuple[str, str]:
     """
     Get commit hash and subject line.
@@ -120,13 +233,18 @@ def get_commit_meta(hash: str, cwd: str = ".") -> tuple[str, str]:
     Returns:
         (full_hash, subject) or (hash, "") on error
     """
-    output = _run_git(["show", "-s", "--format=%H%n%s", hash], cwd)
+    cached = _cache_get("meta", hash, cwd)
+    if cached is not None:
+        return cached
+    
+    output = _run_git([*_SHOW, "-s", "--format=%H%n%s", hash], cwd)
     if not output:
         return (hash, "")
     
     lines = output.splitlines()
     full_hash = lines[0] if lines else hash
     subject = lines[1] if len(lines) > 1 else ""
+    _cache_store("meta", cwd, {hash: (full_hash, subject)})
     return (full_hash, subject)
 
 
@@ -137,11 +255,20 @@ def get_name_status(hash: str, cwd: str = ".") -> str:
     Returns:
         Lines like "A    file.py" or "R100    old.py    new.py"
     """
+    cached = _cache_get("name-status", hash, cwd)
+    if cached is not None:
+        return cached
+    
     output = _run_git(
-        ["show", "--pretty=format:", "--name-status", "-M", "-C", hash],
+        [*_SHOW, "--pretty=format:", "--name-status", "-M", "-C", hash],
         cwd
     )
-    return output.rstrip() if output else ""
+    if output is None:
+        return ""
+    
+    name_status = output.rstrip()
+    _cache_store("name-status", cwd, {hash: name_status})
+    return name_status
 
 
 def get_patch_unified(hash: str, cwd: str = ".") -> str:
@@ -150,11 +277,20 @@ def get_patch_unified(hash: str, cwd: str = ".") -> str:
     
     Uses --unified=0 for most compact representation.
     """
+    cached = _cache_get("patch", hash, cwd)
+    if cached is not None:
+        return cached
+    
     output = _run_git(
-        ["show", "--pretty=format:", "--patch", "--unified=0", "-M", "-C", hash],
+        [*_SHOW, "--pretty=format:", "--patch", "--unified=0", "-M", "-C", hash],
         cwd
     )
-    return output.rstrip() if output else ""
+    if output is None:
+        return ""
+    
+    patch = output.rstrip()
+    _cache_store("patch", cwd, {hash: patch})
+    return patch
 
 
 def truncate_patch(patch: str, max_lines_per_file: int = 50) -> str:
@@ -175,99 +311,103 @@ def truncate_patch(patch: str, max_lines_per_file: int = 50) -> str:
     if not patch:
         return ""
     
-    lines = patch.splitlines()
-    result = []
-    current_file_start = None
-    current_filename = None
-    in_file = False
-    
-    def extract_filename(diff_line: str) -> str:
-        """Extract filename from 'diff --git a/file b/file' line."""
-        parts = diff_line.split(" b/")
-        return parts[-1] if len(parts) > 1 else diff_line
-    
-    def is_deleted_file(file_content: list[str]) -> bool:
-        """Check if this is a deleted file diff."""
-        # Skip first line (always "diff --git...")
-        for line in file_content[1:]:
-            if line.startswith("deleted file mode"):
-                return True
-            if line.startswith("@@"):
-                break
-        return False
-    
-    def is_new_file(file_content: list[str]) -> bool:
-        """Check if this is a new file diff."""
-        # Skip first line (always "diff --git...")
-        for line in file_content[1:]:
-            if line.startswith("new file mode"):
-                return True
-            if line.startswith("@@"):
-                break
-        return False
+    # File boundaries come from one regex scan, not a per-line loop
+    starts = [m.start() for m in _FILE_DIFF_START.finditer(patch)]
+    if not starts:
+        return patch
+    
+    # Anything before the first file diff is dropped
+    result: list[str] = []
+    for start, end in zip(starts, starts[1:] + [len(patch)]):
+        file_diff = _FileDiff(max_lines_per_file)
+        file_diff.feed(patch[start:end])
+        result.extend(file_diff.finish())
+    return "\n".join(result)
+
+
+class _FileDiff:
+    """
+    One file's diff for truncate_patch(), fed as consecutive pieces of text.
     
-    def is_rename_only(file_content: list[str]) -> tuple[bool, str | None]:
-        """Check if this is a rename with no content changes. Returns (is_rename_only, old_name)."""
-        old_name = None
-        has_rename = False
-        has_hunks = False
-        
-        # Skip first line (always "diff --git...")
-        for line in file_content[1:]:
-            if line.startswith("rename from "):
-                old_name = line.replace("rename from ", "").strip()
-                has_rename = True
-            if line.startswith("@@"):
-                has_hunks = True
-                break
-        
-        return (has_rename and not has_hunks, old_name)
+    Lines are counted with str.count() and the text is only kept while the
+    file is short enough to be shown in full, so a large diff is never split
+    into lines or held in memory. Lines end at "\\n" only.
+    """
     
-    def process_file(file_content: list[str], filename: str):
-        """Process a single file's diff content."""
-        # Check for deleted file
-        if is_deleted_file(file_content):
-            result.append(f"D  {filename}")
+    def __init__(self, max_lines: int):
+        self.max_lines = max_lines
+        self.diff_line = ""
+        self.newlines = 0
+        self.ends_with_newline = False
+        self.kept: Optional[list[str]] = []
+        # Text before the first hunk, until it has been parsed. Header flags
+        # only look at these lines, like the full-diff checks they replace.
+        self.header: Optional[list[str]] = []
+        self.in_hunks = False
+        self.deleted = False
+        self.new_file = False
+        self.renamed_from: Optional[str] = None
+    
+    def feed(self, text: str) -> None:
+        if not text:
             return
+        if not self.newlines:
+            # Still on the 'diff --git a/file b/file' line
+            self.diff_line += text.partition("\n")[0]
         
-        # Check for rename-only
-        rename_only, old_name = is_rename_only(file_content)
-        if rename_only and old_name:
-            result.append(f"R  {old_name} -> {filename}")
-            return
+        self.newlines += text.count("\n")
+        self.ends_with_newline = text.endswith("\n")
+        if self.kept is not None:
+            if self.newlines > self.max_lines:
+                # Too large to show - only the count matters from here on
+                self.kept = None
+            else:
+                self.kept.append(text)
         
-        # Check for new file that's too large
-        if is_new_file(file_content) and len(file_content) > max_lines_per_file:
-            result.append(f"A  [{len(file_content)} lines] {filename}")
-            return
+        if self.header is not None:
+            header = "".join(self.header) + text
+            hunk = _HUNK_START.search(header)
+            if hunk:
+                self.in_hunks = True
+                self._parse_header(header[:hunk.start()])
+            else:
+                self.header = [header]
+    
+    def _parse_header(self, header: str) -> None:
+        self.header = None
+        # Skip first line (always "diff --git...")
+        for line in header.split("\n")[1:]:
+            if line.startswith("deleted file mode"):
+                self.deleted = True
+            elif line.startswith("new file mode"):
+                self.new_file = True
+            elif line.startswith("rename from "):
+                self.renamed_from = line.replace("rename from ", "").strip()
+    
+    def finish(self) -> list[str]:
+        """Return the file's lines, or the one-line summary shown instead."""
+        if self.header is not None:
+            # No hunks - the whole diff is header
+            self._parse_header("".join(self.header))
         
-        # Check for modified file that's too large
-        if len(file_content) > max_lines_per_file:
-            result.append(f"M  [{len(file_content)} lines] {filename}")
-            return
+        # Filename from 'diff --git a/file b/file'
+        parts = self.diff_line.split(" b/")
+        filename = parts[-1] if len(parts) > 1 else self.diff_line
+        line_count = self.newlines + (0 if self.ends_with_newline else 1)
         
-        # Include full diff
-        result.extend(file_content)
-    
-    for i, line in enumerate(lines):
-        # Detect start of new file diff
-        if line.startswith("diff --git "):
-            # Process previous file if any
-            if in_file and current_file_start is not None:
-                file_content = lines[current_file_start:i]
-                process_file(file_content, current_filename or "unknown")
-            
-            # Start new file
-            current_file_start = i
-            current_filename = extract_filename(line)
-            in_file = True
+        if self.deleted:
+            return [f"D  {filename}"]
+        if self.renamed_from and not self.in_hunks:
+            # Rename with no content changes
+            return [f"R  {self.renamed_from} -> {filename}"]
+        if line_count > self.max_lines:
+            status = "A" if self.new_file else "M"
+            return [f"{status}  [{line_count} lines] {filename}"]
         
-    # Process last file
-    if in_file and current_file_start is not None:
-        file_content = lines[current_file_start:]
-        process_file(file_content, current_filename or "unknown")
-    
-    return "\n".join(result) if result else patch
+        lines = "".join(self.kept).split("\n")
+        if self.ends_with_newline:
+            lines.pop()
+        return lines
 
 
 def format_commit_diff(hash: str, cwd: str = ".") -> str:
@@ -283,13 +423,61 @@ def format_commit_diff(hash: str, cwd: str = ".") -> str:
     
     Note: File list (@f) is omitted as it's redundant with the patch.
     """
-    commit_hash, subject = get_commit_meta(hash, cwd)
-    patch = get_patch_unified(hash, cwd)
+    cached = _cache_get("diff", hash, cwd)
+    if cached is not None:
+        return cached
+    
+    results = _show_batch([hash], _BUNDLE_HEADER, _BUNDLE_ARGS, cwd, _read_commit_diff)
+    if results is None:
+        return _format_commit(hash, "", "")
+    
+    diff, name_status = results[0]
+    _cache_store("diff", cwd, {hash: diff})
+    _cache_store("name-status", cwd, {hash: name_status})
+    return diff
+
+
+def _split_bundle(section: str) -> tuple[str, str, str, str]:
+    """
+    Split one commit's _BUNDLE_HEADER/_BUNDLE_ARGS `git show` section.
     
-    # Truncate large diffs to avoid context overload
-    if patch:
-        patch = truncate_patch(patch)
+    Returns:
+        (full_hash, subject, name_status, patch)
+    """
+    commit_hash, _, rest = section.partition("\n")
+    subject, _, rest = rest.partition("\n")
+    lines = rest.lstrip("\n").split("\n")
+    
+    # --patch-with-raw lists ":<modes> <blobs> <status>\t<paths>" lines, then
+    # a blank line and the patch. Status and paths are the name-status line.
+    name_status = []
+    raw_count = 0
+    for line in lines:
+        if not line.startswith(":"):
+            break
+        raw, _, paths = line.partition("\t")
+        name_status.append(f"{raw.rsplit(' ', 1)[-1]}\t{paths}")
+        raw_count += 1
+    
+    patch = "\n".join(lines[raw_count:]).lstrip("\n").rstrip()
+    return (commit_hash, subject, "\n".join(name_status).rstrip(), patch)
+
+
+def _read_commit_diff(head: str, file_lines: Optional[list[str]]) -> tuple[str, str]:
+    """
+    Read one commit's _BUNDLE_HEADER/_BUNDLE_ARGS section from _scan_show().
     
+    Returns:
+        (format_commit_diff() output, name-status)
+    """
+    commit_hash, subject, name_status, patch = _split_bundle(head)
+    if file_lines is not None:
+        patch = "\n".join(file_lines)
+    return _format_commit(commit_hash, subject, patch), name_status
+
+
+def _format_commit(commit_hash: str, subject: str, patch: str) -> str:
+    """Build the @c/@s/@p/@end block for one commit from its truncated patch."""
     parts = [f"@c {commit_hash}"]
     
     if subject:
@@ -304,6 +492,368 @@ def format_commit_diff(hash: str, cwd: str = ".") -> str:
     return "\n".join(parts)
 
 
+def _unique_hashes(git_hashes: list[str]) -> list[str]:
+    """Strip hashes and drop empty or repeated ones, keeping first-seen order."""
+    return list(dict.fromkeys(h.strip() for h in git_hashes if h and h.strip()))
+
+
+def _run_git_chunks(args: list[str], cwd: str = ".") -> Iterator[str]:
+    """
+    Run git command and yield its output in chunks as it arrives.
+    
+    Raises:
+        OSError: If git can't be started
+        subprocess.CalledProcessError: If git exits with an error, once its
+            output has been read
+    """
+    with subprocess.Popen(
+        ["git", "-C", cwd] + args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        errors="replace",
+    ) as proc:
+        while chunk := proc.stdout.read(_READ_SIZE):
+            yield chunk
+        returncode = proc.wait()
+    
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, args)
+
+
+def _section_pieces(chunks: Iterable[str]) -> Iterator[tuple[bool, str]]:
+    """
+    Re-cut streamed output at _SECTION_START lines.
+    
+    Chunks are cut at their last newline (the rest is carried over), so
+    every piece holds whole lines and one regex scan per chunk finds the
+    section starts.
+    
+    Yields:
+        (whether the piece starts a section, piece text)
+    """
+    carry: list[str] = []
+    for chunk in chain(chunks, [None]):
+        if chunk is None:
+            text = "".join(carry)
+        else:
+            end = chunk.rfind("\n") + 1
+            if not end:
+                carry.append(chunk)
+                continue
+            text = "".join(carry) + chunk[:end]
+            carry = [chunk[end:]]
+        
+        starts = [m.start() for m in _SECTION_START.finditer(text)]
+        if text and (not starts or starts[0]):
+            yield False, text[:starts[0] if starts else len(text)]
+        for start, end in zip(starts, starts[1:] + [len(text)]):
+            yield True, text[start:end]
+
+
+def _scan_show(
+    chunks: Iterable[str],
+    header_lines: int,
+    max_lines_per_file: int = 50,
+) -> Iterator[tuple[str, Optional[list[str]]]]:
+    """
+    Split batched `git show` output into commits, truncating their file
+    diffs (see truncate_patch) as the output streams in.
+    
+    A commit's text up to its first file diff is kept whole; file diffs go
+    through _FileDiff, so memory stays bounded however big the patch. Each
+    commit's patch is right-stripped before truncation.
+    
+    Args:
+        chunks: `git show` output, each commit starting with _COMMIT_MARKER
+        header_lines: Lines in each commit's format header (never file diffs)
+        max_lines_per_file: Maximum lines to show per file diff (default 50)
+    
+    Yields:
+        (head, file_lines) per commit: the text after the marker up to the
+        first file diff, and the truncated file diff lines (None if the
+        commit has no file diff)
+    """
+    # Output before the first marker belongs to no commit and is dropped
+    head: Optional[list[str]] = None
+    head_newlines = 0
+    file_lines: Optional[list[str]] = None
+    current: Optional[_FileDiff] = None
+    # Trailing whitespace, fed on only once more text of the commit follows
+    pending = ""
+    
+    def commit() -> tuple[str, Optional[list[str]]]:
+        if current is not None:
+            file_lines.extend(current.finish())
+        return "".join(head), file_lines
+    
+    for starts, text in _section_pieces(chunks):
+        if starts and text.startswith(_COMMIT_MARKER):
+            if head is not None:
+                yield commit()
+            head, head_newlines = [], 0
+            file_lines = current = None
+            pending = ""
+            text = text[len(_COMMIT_MARKER):]
+        elif starts and head is not None and (current is not None or head_newlines >= header_lines):
+            if current is None:
+                file_lines = []
+            else:
+                current.feed(pending)
+                file_lines.extend(current.finish())
+            current = _FileDiff(max_lines_per_file)
+            pending = ""
+        
+        if head is None:
+            continue
+        if current is None:
+            head.append(text)
+            head_newlines += text.count("\n")
+            continue
+        
+        body = text.rstrip()
+        if not body:
+            pending += text
+            continue
+        current.feed(pending + body)
+        pending = text[len(body):]
+    
+    if head is not None:
+        yield commit()
+
+
+def _show_batch(
+    hashes: list[str],
+    header: str,
+    args: list[str],
+    cwd: str,
+    read: Callable[[str, Optional[list[str]]], _T],
+) -> Optional[list[_T]]:
+    """
+    Run a single `git show` over several commits.
+    
+    Output is streamed through _scan_show(), so no full copy of it is ever
+    held, and read gets each commit's (head, file_lines) - the head starting
+    with the expanded header format.
+    
+    Returns:
+        read()'s result per hash (in input order), or None if the batch
+        can't be used
+    """
+    try:
+        results = [
+            read(head, file_lines)
+            for head, file_lines in _scan_show(
+                _run_git_chunks(
+                    [*_SHOW, f"--format={_COMMIT_MARKER_FORMAT}{header}", *args, *hashes],
+                    cwd
+                ),
+                header.count("%n") + 1,
+            )
+        ]
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+    
+    if len(results) != len(hashes):
+        return None
+    return results
+
+
+def _commit_objects(hashes: list[str], cwd: str) -> set[str]:
+    """
+    Find which of hashes name commits, with one `git cat-file --batch-check`.
+    
+    Returns:
+        The hashes that resolve to commit objects (empty on error)
+    """
+    # A name containing a newline would break the one-line-per-name framing
+    names = [h for h in hashes if "\n" not in h]
+    output = _run_git(
+        ["cat-file", "--batch-check=%(objecttype)"],
+        cwd,
+        input="".join(f"{h}\n" for h in names),
+    )
+    if output is None:
+        return set()
+    
+    # One line per name: the object type, or "<name> missing"
+    lines = output.splitlines()
+    if len(lines) != len(names):
+        return set()
+    return {h for h, line in zip(names, lines) if line == "commit"}
+
+
+def _show_commits(
+    hashes: list[str],
+    header: str,
+    args: list[str],
+    cwd: str,
+    read: Callable[[str, Optional[list[str]]], _T],
+) -> tuple[dict[str, _T], bool]:
+    """
+    Batch `git show` over hashes, tolerating names that aren't commits.
+    
+    If the whole batch fails (e.g. an unknown hash), one cat-file call picks
+    out the real commits and they are shown in a second batch, instead of
+    falling back to separate processes for every hash.
+    
+    Returns:
+        (hash -> read() result for the hashes that could be shown,
+        whether every hash was shown by the first batch)
+    """
+    results = _show_batch(hashes, header, args, cwd, read)
+    if results is not None:
+        return dict(zip(hashes, results)), True
+    
+    commits = _commit_objects(hashes, cwd)
+    valid = [h for h in hashes if h in commits]
+    if valid and len(valid) < len(hashes):
+        results = _show_batch(valid, header, args, cwd, read)
+        if results is not None:
+            return dict(zip(valid, results)), False
+    return {}, False
+
+
+def _cached_batch(
+    kind: str,
+    git_hashes: list[str],
+    cwd: str,
+    fetch: Callable[[list[str], str], tuple[dict[str, str], bool]],
+) -> dict[str, str]:
+    """
+    Serve batch results from the LRU cache, fetching only the misses.
+    
+    fetch returns (results, cacheable); results from a failed batch (e.g. an
+    unknown hash) and non-hex refs like HEAD are never cached.
+    """
+    hashes = _unique_hashes(git_hashes)
+    if not hashes:
+        return {}
+    
+    try:
+        repo = os.path.abspath(cwd)
+    except OSError:
+        # Working directory no longer exists - let git report the error
+        return fetch(hashes, cwd)[0]
+    
+    results: dict[str, str] = {}
+    misses = []
+    with _show_cache_lock:
+        for h in hashes:
+            cached = _show_cache.get((kind, repo, h))
+            if cached is None:
+                misses.append(h)
+            else:
+                _show_cache.move_to_end((kind, repo, h))
+                results[h] = cached
+    
+    if misses:
+        fetched, cacheable = fetch(misses, cwd)
+        results.update(fetched)
+        if cacheable:
+            _cache_store(kind, cwd, {h: fetched[h] for h in misses})
+    
+    # Keep the caller's order
+    return {h: results[h] for h in hashes}
+
+
+def _cache_get(kind: str, hash: str, cwd: str) -> Any:
+    """Cached result for one commit, or None on a miss."""
+    try:
+        key = (kind, os.path.abspath(cwd), hash)
+    except OSError:
+        return None
+    
+    with _show_cache_lock:
+        cached = _show_cache.get(key)
+        if cached is not None:
+            _show_cache.move_to_end(key)
+    return cached
+
+
+def _cache_store(kind: str, cwd: str, entries: dict[str, Any]) -> None:
+    """Add hash -> result entries to the LRU cache (non-hex refs are skipped)."""
+    try:
+        repo = os.path.abspath(cwd)
+    except OSError:
+        return
+    
+    with _show_cache_lock:
+        for h, value in entries.items():
+            if _HEX_DIGITS.issuperset(h):
+                _show_cache[(kind, repo, h)] = value
+                _show_cache.move_to_end((kind, repo, h))
+        while len(_show_cache) > SHOW_CACHE_SIZE:
+            _show_cache.popitem(last=False)
+
+
+def _map_commits(func: Callable[[str, str], str], hashes: list[str], cwd: str) -> dict[str, str]:
+    """
+    Run a per-commit helper for hashes a batch couldn't show.
+    
+    Each call waits on its own git process, so a small thread pool overlaps
+    them. Returns hash -> func(hash, cwd).
+    """
+    if len(hashes) <= 1:
+        return {h: func(h, cwd) for h in hashes}
+    
+    # map() preserves input order
+    with ThreadPoolExecutor(max_workers=min(MAX_GIT_WORKERS, len(hashes))) as executor:
+        return dict(zip(hashes, executor.map(lambda h: func(h, cwd), hashes)))
+
+
+def get_name_status_batch(git_hashes: list[str], cwd: str = ".") -> dict[str, str]:
+    """
+    Get name-status output for many commits with one git process.
+    
+    Results are cached per commit. Falls back to one call per commit if the
+    batch fails (e.g. an unknown hash).
+    
+    Returns:
+        Dict of stripped hash -> get_name_status() output
+    """
+    return _cached_batch("name-status", git_hashes, cwd, _fetch_name_status)
+
+
+def _fetch_name_status(hashes: list[str], cwd: str) -> tuple[dict[str, str], bool]:
+    results, cacheable = _show_commits(
+        hashes, "%H", ["--name-status", "-M", "-C"], cwd, _read_name_status
+    )
+    results.update(_map_commits(get_name_status, [h for h in hashes if h not in results], cwd))
+    return results, cacheable
+
+
+def _read_name_status(head: str, file_lines: Optional[list[str]]) -> str:
+    """Read one commit's "%H" + --name-status `git show` section."""
+    return head.partition("\n")[2].lstrip("\n").rstrip()
+
+
+def get_commit_diffs_batch(git_hashes: list[str], cwd: str = ".") -> dict[str, str]:
+    """
+    Format many commits (see format_commit_diff) with one git process.
+    
+    Results are cached per commit. Falls back to one format_commit_diff()
+    per commit if the batch fails.
+    
+    Returns:
+        Dict of stripped hash -> formatted commit diff
+    """
+    return _cached_batch("diff", git_hashes, cwd, _fetch_commit_diffs)
+
+
+def _fetch_commit_diffs(hashes: list[str], cwd: str) -> tuple[dict[str, str], bool]:
+    results, cacheable = _show_commits(hashes, _BUNDLE_HEADER, _BUNDLE_ARGS, cwd, _read_commit_diff)
+    
+    diffs = {h: diff for h, (diff, _) in results.items()}
+    name_status = {h: ns for h, (_, ns) in results.items()}
+    diffs.update(_map_commits(format_commit_diff, [h for h in hashes if h not in results], cwd))
+    
+    # The same output answers get_name_status_batch() for these commits
+    if cacheable:
+        _cache_store("name-status", cwd, name_status)
+    return diffs, cacheable
+
+
 def generate_epic_diff(git_hashes: list[str], cwd: str = ".") -> str:
     """
     Generate LLM-optimized diff for multiple commits in chronological order.
@@ -318,13 +868,11 @@ def generate_epic_diff(git_hashes: list[str], cwd: str = ".") -> str:
     if not git_hashes:
         return ""
     
-    # Filter out empty hashes and format each commit
-    commit_diffs = []
-    for hash in git_hashes:
-        if hash and hash.strip():
-            diff = format_commit_diff(hash.strip(), cwd)
-            if diff:
-                commit_diffs.append(diff)
+    # Fetch every commit in one git call, then emit in the given order
+    diffs = get_commit_diffs_batch(git_hashes, cwd)
+    commit_diffs = [
+        diffs[h.strip()] for h in git_hashes if h and h.strip() and diffs.get(h.strip())
+    ]
     
     if not commit_diffs:
         return ""
@@ -346,47 +894,48 @@ def generate_epic_files_changed(git_hashes: list[str], cwd: str = ".") -> str:
     if not git_hashes:
         return ""
     
+    name_status = get_name_status_batch(git_hashes, cwd)
+    return format_files_changed(
+        name_status.get(h.strip(), "") for h in git_hashes if h and h.strip()
+    )
+
+
+def format_files_changed(name_status_outputs: Iterable[str]) -> str:
+    """
+    Merge get_name_status() outputs (in chronological order) into a file list.
+    
+    Returns:
+        Sorted lines like "M  file.py", or empty string if no files changed
+    """
     # Collect files with their status (file -> status)
     # Later status overwrites earlier (e.g., A then M -> M)
     files: dict[str, str] = {}
     
-    for hash in git_hashes:
-        if not hash or not hash.strip():
-            continue
-        
-        name_status = get_name_status(hash.strip(), cwd)
+    for name_status in name_status_outputs:
         if not name_status:
             continue
         
         for line in name_status.splitlines():
-            parts = line.split("\t")
-            if not parts:
+            # At most "<status>\t<path>\t<new path>" - no need to split further
+            parts = line.split("\t", 2)
+            if len(parts) < 2:
+                # Blank or header line - no file to record
                 continue
             
             status = parts[0].strip()
             
-            # Normalize status to single letter
-            if status.startswith("R"):
-                status_char = "R"
-            elif status.startswith("C"):
-                status_char = "C"
-            else:
-                status_char = status[0] if status else "M"
+            # Normalize status to single letter (R/C carry a similarity score)
+            status_char = status[0] if status else "M"
             
-            # Get filename based on operation type
-            if status.startswith("R") and len(parts) > 2:
-                # For renames, include the new filename
+            # For renames, include the new filename
+            if status_char == "R" and len(parts) > 2:
                 files[parts[2]] = status_char
-            elif len(parts) > 1:
+            else:
                 files[parts[1]] = status_char
     
     # Build list with status
     if not files:
         return ""
     
-    output = []
-    for f in sorted(files.keys()):
-        output.append(f"{files[f]}  {f}")
-    
-    return "\n".join(output)
+    return "\n".join(f"{files[f]}  {f}" for f in sorted(files))
 
@@ -3,10 +3,7 @@
 from pathlib import Path
 from typing import List
 
-
-def get_template_path(name: str) -> Path:
-    """Get path to a template file."""
-    return Path(__file__).parent.parent / "templates" / name
+from ..templates import get_template_path
 
 
 def create_command_files() -> List[str]:
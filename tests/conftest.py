@@ -1,10 +1,11 @@
 """Pytest configuration and fixtures."""
 
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from moderails.db.models import Base
@@ -40,6 +41,28 @@ def test_db():
     Base.metadata.drop_all(engine)
 
 
+@pytest.fixture
+def sql_statements():
+    """Record the SQL a session sends while a block runs.
+    
+    Usage:
+        with sql_statements(test_db) as statements:
+            ...
+    """
+    @contextmanager
+    def capture(session):
+        statements = []
+        engine = session.get_bind()
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+    
+    return capture
+
+
 @pytest.fixture
 def mock_git_repo(temp_dir):
     """Create a mock git repository for testing."""
@@ -281,6 +281,25 @@ class TestEpicCommands:
             
             assert result.exit_code == 0
             assert "Created epic" in result.output
+    
+    def test_epic_create_with_skills(self, cli_runner):
+        """Test creating an epic validates skills against skills/ directory."""
+        with cli_runner.isolated_filesystem():
+            cli_runner.invoke(cli, ['init'])
+            skill_dir = Path.cwd() / "skills" / "testing"
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text("# Testing")
+            
+            result = cli_runner.invoke(cli, [
+                'epic', 'create',
+                '--name', 'skilled-epic',
+                '--skills', 'testing',
+                '--skills', 'unknown',
+            ])
+            
+            assert result.exit_code == 0
+            assert "Unknown skills ignored: unknown" in result.output
+            assert "Skills: testing" in result.output
 
 
 class TestMigrateCommand:
@@ -30,6 +30,31 @@ class TestFindConfigPath:
         """Test when no config.json exists."""
         found = find_config_path(temp_dir)
         assert found is None
+    
+    def test_save_config_invalidates_cached_lookup(self, temp_dir, monkeypatch):
+        """Test that a cached miss is cleared once config.json is saved."""
+        monkeypatch.chdir(temp_dir)
+        assert find_config_path() is None
+        
+        config_path = save_config({"version": "1.0"})
+        
+        assert find_config_path() == config_path.resolve()
+    
+    def test_cached_hit_rechecked_after_removal(self, temp_dir):
+        """Test that a cached config path is not returned once the file is gone."""
+        outer = temp_dir / "_moderails"
+        outer.mkdir()
+        (outer / "config.json").write_text("{}")
+        inner = temp_dir / "project" / "_moderails"
+        inner.mkdir(parents=True)
+        (inner / "config.json").write_text("{}")
+        
+        start = temp_dir / "project"
+        assert find_config_path(start) == (inner / "config.json").resolve()
+        
+        (inner / "config.json").unlink()
+        
+        assert find_config_path(start) == (outer / "config.json").resolve()
 
 
 class TestLoadConfig:
@@ -91,4 +91,77 @@ class TestContextService:
         
         assert service.context_dir.exists()
         assert service.mandatory_dir.exists()
-
+    
+    def test_load_memories_preserves_order(self, temp_dir):
+        """Test that memories are returned in requested order with missing ones reported."""
+        service = ContextService(temp_dir)
+        service.ensure_directories()
+        
+        (service.memories_dir / "auth.md").write_text("Auth notes")
+        (service.memories_dir / "payments.md").write_text("Payments notes")
+        (service.memories_dir / "api.md").write_text("API notes")
+        
+        result = service.load_memories(["payments", "missing", "auth", "api"])
+        
+        assert result.index("### MEMORY: payments") < result.index("### MEMORY: auth") < result.index("### MEMORY: api")
+        assert "⚠️ Not found: missing" in result
+    
+    def test_get_files_tree_from_history(self, temp_dir):
+        """Test that the files tree collects files_changed and skips bad lines."""
+        service = ContextService(temp_dir)
+        service.history_file.write_text(
+            '{"name": "a", "files_changed": ["src/app.py", "tox.ini"]}\n'
+            '\n'
+            'not json "files_changed"\n'
+            '{"name": "b"}\n'
+            '{"name": "c", "files_changed": ["src/app.py", "src/util.py"]}\n'
+        )
+        
+        result = service.get_files_tree()
+        
+        assert result == "src/\n  app.py\n  util.py\n./\n  tox.ini"
+    
+    def test_get_files_tree_groups_by_directory(self, temp_dir):
+        """Test tree grouping, including top-level files before any directory."""
+        service = ContextService(temp_dir)
+        service.history_file.write_text(
+            '{"files_changed": ["b/x.py", "README.md", "a/y.py", "a/z.py"]}\n'
+        )
+        
+        result = service.get_files_tree()
+        
+        assert result == "  README.md\na/\n  y.py\n  z.py\nb/\n  x.py"
+    
+    def test_load_memories_separates_sections(self, temp_dir):
+        """Test that each loaded memory is its own section, split by a separator."""
+        service = ContextService(temp_dir)
+        service.ensure_directories()
+        
+        (service.memories_dir / "auth.md").write_text("Auth notes")
+        (service.memories_dir / "api.md").write_text("API notes")
+        
+        result = service.load_memories(["auth", "api"])
+        
+        assert result == (
+            "## LOADED MEMORIES\n\n"
+            "### MEMORY: auth\nAuth notes\n"
+            "\n---\n"
+            "### MEMORY: api\nAPI notes\n"
+        )
+    
+    def test_context_files_read_as_text(self, temp_dir):
+        """Test CRLF files load with plain newlines and memories can live in subdirectories."""
+        service = ContextService(temp_dir)
+        service.ensure_directories()
+        
+        (service.mandatory_dir / "rules.md").write_bytes(b"Rule one\r\nRule two\r\n")
+        (service.memories_dir / "team").mkdir()
+        (service.memories_dir / "team" / "auth.md").write_bytes(b"Auth\r\nnotes")
+        
+        assert "Rule one\nRule two\n" in service.load_mandatory_context()
+        assert "\r" not in service.load_mandatory_context()
+        assert service.load_memories(["team/auth", "team/missing"]) == (
+            "## LOADED MEMORIES\n\n"
+            "### MEMORY: team/auth\nAuth\nnotes\n"
+            "\n\n⚠️ Not found: team/missing"
+        )
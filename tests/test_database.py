@@ -1,9 +1,12 @@
 """Tests for database module."""
 
+from datetime import datetime
+
 import pytest
+from sqlalchemy import text
 
-from moderails.db.database import init_db, find_db_path
-from moderails.db.models import Epic, Task, TaskStatus
+from moderails.db.database import init_db, find_db_path, get_engine
+from moderails.db.models import Epic, Session, Task, TaskStatus, generate_task_id
 
 
 class TestInitDb:
@@ -39,6 +42,16 @@ class TestInitDb:
         content = gitignore_path.read_text()
         assert "*.db" in content
         assert "tasks/" in content
+    
+    def test_init_db_private_appends_root_gitignore(self, temp_dir, monkeypatch):
+        """Test that private mode appends the pattern to root .gitignore once."""
+        monkeypatch.chdir(temp_dir)
+        (temp_dir / ".gitignore").write_text("node_modules/")
+        
+        init_db(private=True)
+        init_db(private=True)
+        
+        assert (temp_dir / ".gitignore").read_text() == "node_modules/\n\n*moderails*\n"
 
 
 class TestFindDbPath:
@@ -61,6 +74,37 @@ class TestFindDbPath:
         assert found is None
 
 
+class TestGetEngine:
+    """Tests for get_engine function."""
+    
+    def test_engine_is_per_thread(self, temp_dir, monkeypatch):
+        """Test that each thread gets its own engine while a thread reuses its own."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        monkeypatch.chdir(temp_dir)
+        db_path = init_db()
+        
+        engine = get_engine(db_path)
+        assert get_engine() is engine
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(get_engine, db_path).result()
+        
+        assert other is not engine
+        other.dispose()
+    
+    def test_engine_connections_are_tuned(self, temp_dir, monkeypatch):
+        """Test that connect-time PRAGMAs are applied to engine connections."""
+        monkeypatch.chdir(temp_dir)
+        db_path = init_db()
+        
+        with get_engine(db_path).connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            # synchronous=NORMAL is reported as 1
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -20000
+
+
 class TestEpicModel:
     """Tests for Epic model."""
     
@@ -84,6 +128,27 @@ class TestEpicModel:
         assert data["name"] == "test-epic"
         assert "id" in data
     
+    def test_epic_skills_json_column(self, test_db):
+        """Test skills round-trip through the JSON text column."""
+        epic = Epic(name="skills-epic")
+        test_db.add(epic)
+        test_db.commit()
+        
+        assert epic.add_skill("a") is True
+        assert epic.add_skill("a") is False
+        assert epic.add_skill("b") is True
+        assert epic.remove_skill("a") is True
+        test_db.commit()
+        
+        raw = test_db.execute(text("SELECT skills FROM epics WHERE id = :id"), {"id": epic.id}).scalar()
+        assert raw == '["b"]'
+        
+        # Invalid stored JSON loads as an empty list
+        test_db.execute(text("UPDATE epics SET skills = 'oops' WHERE id = :id"), {"id": epic.id})
+        test_db.commit()
+        test_db.refresh(epic)
+        assert epic.get_skills() == []
+    
     def test_epic_unique_name(self, test_db):
         """Test that epic names must be unique."""
         epic1 = Epic(name="duplicate")
@@ -100,6 +165,15 @@ class TestEpicModel:
 class TestTaskModel:
     """Tests for Task model."""
     
+    def test_generate_task_id_format(self):
+        """Test generated IDs are 6 lowercase alphanumeric characters."""
+        ids = {generate_task_id() for _ in range(200)}
+        
+        assert len(ids) > 190
+        for task_id in ids:
+            assert len(task_id) == 6
+            assert task_id.isalnum() and task_id == task_id.lower()
+    
     def test_create_task(self, test_db):
         """Test creating a task."""
         epic = Epic(name="test-epic")
@@ -142,6 +216,36 @@ class TestTaskModel:
         assert data["summary"] == "Test summary"
         assert data["status"] == "draft"
     
+    def test_task_status_stored_by_name(self, test_db):
+        """Test enum columns keep the member-name storage format and reject unknown values."""
+        from sqlalchemy.exc import IntegrityError
+        
+        task = Task(name="stored", file_name="s.md", status=TaskStatus.IN_PROGRESS)
+        test_db.add(task)
+        test_db.commit()
+        
+        raw = test_db.execute(text("SELECT status FROM tasks WHERE id = :id"), {"id": task.id}).scalar()
+        assert raw == "IN_PROGRESS"
+        
+        with pytest.raises(IntegrityError):
+            test_db.execute(text("UPDATE tasks SET status = 'bogus' WHERE id = :id"), {"id": task.id})
+        test_db.rollback()
+    
+    def test_task_epic_loaded_with_task(self, test_db, sql_statements):
+        """Test listing tasks does not lazy-load each task's epic (no N+1)."""
+        epic = Epic(name="joined-epic")
+        test_db.add(epic)
+        test_db.commit()
+        test_db.add_all([Task(name=f"task-{i}", file_name="", epic_id=epic.id) for i in range(3)])
+        test_db.commit()
+        test_db.expunge_all()
+        
+        with sql_statements(test_db) as statements:
+            names = [t.epic.name for t in test_db.query(Task).all()]
+        
+        assert names == ["joined-epic"] * 3
+        assert len(statements) == 1
+    
     def test_task_file_path_property(self, test_db):
         """Test Task file_path property."""
         epic = Epic(name="my-epic")
@@ -195,3 +299,47 @@ class TestTaskModel:
         
         assert task.git_hash == "abc123def456"
 
+    
+    def test_task_created_at_set_by_database(self, test_db):
+        """Test created_at is filled in by the INSERT with sub-second precision."""
+        tasks = [Task(name=f"task-{i}", file_name=f"t{i}.md") for i in range(3)]
+        test_db.add_all(tasks)
+        test_db.commit()
+        
+        for task in tasks:
+            assert isinstance(task.created_at, datetime)
+        
+        raw = test_db.execute(text("SELECT created_at FROM tasks LIMIT 1")).scalar()
+        assert "." in raw
+    
+    def test_epic_summary_query_uses_composite_index(self, test_db):
+        """Test the completed-tasks-of-epic query is an index range scan with no sort."""
+        plan = test_db.execute(text(
+            "EXPLAIN QUERY PLAN SELECT name, summary, completed_at, git_hash FROM tasks "
+            "WHERE epic_id = 'abc123' AND status = 'COMPLETED' ORDER BY completed_at"
+        )).all()
+        details = " ".join(row[-1] for row in plan)
+        
+        assert "ix_tasks_epic_status_completed" in details
+        assert "TEMP B-TREE" not in details
+
+
+class TestSessionModel:
+    """Tests for Session model."""
+    
+    def test_session_updated_at_advances_on_update(self, test_db):
+        """Test updated_at is recomputed by the database on each UPDATE."""
+        task = Task(name="task", file_name="t.md")
+        test_db.add(task)
+        test_db.flush()
+        session = Session(task_id=task.id)
+        test_db.add(session)
+        test_db.commit()
+        
+        test_db.execute(text("UPDATE sessions SET updated_at = '2000-01-01 00:00:00.000'"))
+        test_db.commit()
+        
+        session.current_mode = "plan"
+        test_db.commit()
+        
+        assert session.updated_at > datetime(2000, 1, 2)
@@ -11,6 +11,13 @@ from moderails.utils.git import (
     format_commit_diff,
     generate_epic_diff,
     generate_epic_files_changed,
+    format_files_changed,
+    get_commit_diffs_batch,
+    get_current_branch,
+    get_name_status_batch,
+    get_staged_files,
+    get_unstaged_files,
+    get_worktree_state,
     truncate_patch,
 )
 
@@ -38,6 +45,25 @@ def git_repo_with_commits(mock_git_repo):
     return repo_dir, commit_hash
 
 
+@pytest.fixture
+def git_calls(monkeypatch):
+    """Record the subcommand of every git process started by the git utilities."""
+    from moderails.utils import git
+    
+    calls = []
+    real_run_git = git._run_git
+    real_run_git_chunks = git._run_git_chunks
+    monkeypatch.setattr(
+        git, "_run_git",
+        lambda args, cwd=".", input=None: calls.append(args[0]) or real_run_git(args, cwd, input),
+    )
+    monkeypatch.setattr(
+        git, "_run_git_chunks",
+        lambda args, cwd=".": calls.append(args[0]) or real_run_git_chunks(args, cwd),
+    )
+    return calls
+
+
 class TestGetCommitMeta:
     """Tests for get_commit_meta function."""
     
@@ -227,6 +253,278 @@ class TestGenerateEpicFilesChanged:
         assert files.count("test.txt") == 1
 
 
+class TestBatchedShow:
+    """Tests for the single-process batch helpers."""
+    
+    def test_batches_match_per_commit_output(self, git_repo_with_commits):
+        """Test batched output equals the per-commit functions, including bad hashes."""
+        repo_dir, commit_hash = git_repo_with_commits
+        first_hash = subprocess.run(
+            ["git", "rev-parse", "HEAD~1"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True
+        ).stdout.strip()
+        
+        for hashes in ([first_hash, commit_hash], [commit_hash, "deadbeef"]):
+            diffs = get_commit_diffs_batch(hashes, str(repo_dir))
+            name_status = get_name_status_batch(hashes, str(repo_dir))
+            
+            assert list(diffs) == hashes
+            for h in hashes:
+                assert diffs[h] == format_commit_diff(h, str(repo_dir))
+                assert name_status[h] == get_name_status(h, str(repo_dir))
+    
+    def test_batch_uses_one_git_process(self, git_repo_with_commits, git_calls):
+        """Test that valid hashes are fetched with a single git call."""
+        repo_dir, commit_hash = git_repo_with_commits
+        first_hash = subprocess.run(
+            ["git", "rev-parse", "HEAD~1"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True
+        ).stdout.strip()
+        
+        git_calls.clear()
+        
+        diffs = get_commit_diffs_batch([first_hash, commit_hash], str(repo_dir))
+        
+        assert git_calls == ["show"]
+        assert diffs[commit_hash].startswith(f"@c {commit_hash}")
+
+
+    def test_batches_cache_per_commit(self, git_repo_with_commits, monkeypatch, git_calls):
+        """Test that a commit already fetched is not shown by git again."""
+        from moderails.utils import git
+        
+        repo_dir, commit_hash = git_repo_with_commits
+        monkeypatch.setattr(git, "_show_cache", git.OrderedDict())
+        first = get_commit_diffs_batch([commit_hash], str(repo_dir))
+        
+        git_calls.clear()
+        
+        assert get_commit_diffs_batch([commit_hash], str(repo_dir)) == first
+        assert git_calls == []
+    
+    def test_format_commit_diff_matches_separate_calls(self, git_repo_with_commits):
+        """Test the single-call format equals the meta + patch composition."""
+        from moderails.utils.git import _format_commit
+        
+        repo_dir, commit_hash = git_repo_with_commits
+        cwd = str(repo_dir)
+        
+        for h in (commit_hash, "HEAD", "deadbeef"):
+            full_hash, subject = get_commit_meta(h, cwd)
+            expected = _format_commit(full_hash, subject, truncate_patch(get_patch_unified(h, cwd)))
+            assert format_commit_diff(h, cwd) == expected
+    
+    def test_batch_matches_separate_calls(self, git_repo_with_commits, monkeypatch, git_calls):
+        """Test one batched show gives the meta, name-status and patch helpers' output."""
+        from moderails.utils import git
+        
+        repo_dir, _ = git_repo_with_commits
+        cwd = str(repo_dir)
+        (repo_dir / "test.txt").write_text("changed")
+        subprocess.run(["git", "mv", "added.py", "moved.py"], cwd=repo_dir, capture_output=True)
+        subprocess.run(["git", "commit", "-am", "move and edit"], cwd=repo_dir, capture_output=True)
+        hashes = [get_commit_meta(h, cwd)[0] for h in ("HEAD", "HEAD~1")]
+        monkeypatch.setattr(git, "_show_cache", git.OrderedDict())
+        
+        git_calls.clear()
+        diffs = get_commit_diffs_batch(hashes, cwd)
+        name_status = get_name_status_batch(hashes, cwd)
+        assert git_calls == ["show"]
+        
+        for h in hashes:
+            full_hash, subject = get_commit_meta(h, cwd)
+            assert diffs[h] == git._format_commit(full_hash, subject, truncate_patch(get_patch_unified(h, cwd)))
+            assert name_status[h] == get_name_status(h, cwd)
+    
+    def test_diff_batch_primes_name_status(self, git_repo_with_commits, monkeypatch, git_calls):
+        """Test file lists for commits already diffed need no further git call."""
+        from moderails.utils import git
+        
+        repo_dir, commit_hash = git_repo_with_commits
+        monkeypatch.setattr(git, "_show_cache", git.OrderedDict())
+        get_commit_diffs_batch([commit_hash], str(repo_dir))
+        
+        git_calls.clear()
+        
+        name_status = get_name_status_batch([commit_hash], str(repo_dir))
+        
+        assert git_calls == []
+        assert name_status[commit_hash] == "A\tadded.py"
+    
+    def test_per_commit_helpers_are_cached(self, git_repo_with_commits, monkeypatch, git_calls):
+        """Test commit ids are shown by git once, while moving refs are re-read."""
+        from moderails.utils import git
+        
+        repo_dir, commit_hash = git_repo_with_commits
+        cwd = str(repo_dir)
+        monkeypatch.setattr(git, "_show_cache", git.OrderedDict())
+        helpers = (get_commit_meta, get_name_status, get_patch_unified)
+        first = [helper(commit_hash, cwd) for helper in helpers]
+        
+        git_calls.clear()
+        
+        assert [helper(commit_hash, cwd) for helper in helpers] == first
+        assert git_calls == []
+        
+        assert get_name_status("HEAD", cwd) == first[1]
+        assert git_calls == ["show"]
+    
+    def test_bad_hash_does_not_split_batch_per_commit(self, git_repo_with_commits, monkeypatch, git_calls):
+        """Test an unknown hash costs a cat-file check, not a process per commit."""
+        from moderails.utils import git
+        
+        repo_dir, commit_hash = git_repo_with_commits
+        first_hash = subprocess.run(
+            ["git", "rev-parse", "HEAD~1"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True
+        ).stdout.strip()
+        hashes = [first_hash, "deadbeef", commit_hash]
+        expected = {h: format_commit_diff(h, str(repo_dir)) for h in hashes}
+        
+        monkeypatch.setattr(git, "_show_cache", git.OrderedDict())
+        git_calls.clear()
+        
+        assert get_commit_diffs_batch(hashes, str(repo_dir)) == expected
+        # Failed batch, commit check, batch of the valid two, the bad hash alone
+        assert git_calls == ["show", "cat-file", "show", "show"]
+    
+    def test_unshowable_names_are_fetched_concurrently(self, git_repo_with_commits, monkeypatch):
+        """Test per-commit fallbacks run on worker threads and keep input order."""
+        import threading
+        from moderails.utils import git
+        
+        repo_dir, commit_hash = git_repo_with_commits
+        cwd = str(repo_dir)
+        hashes = ["deadbeef", commit_hash, "HEAD~1^{tree}", "cafebabe"]
+        expected_diffs = {h: format_commit_diff(h, cwd) for h in hashes}
+        expected_name_status = {h: get_name_status(h, cwd) for h in hashes}
+        
+        monkeypatch.setattr(git, "_show_cache", git.OrderedDict())
+        threads = set()
+        real_format = git.format_commit_diff
+        monkeypatch.setattr(
+            git, "format_commit_diff",
+            lambda h, cwd=".": threads.add(threading.get_ident()) or real_format(h, cwd),
+        )
+        
+        diffs = get_commit_diffs_batch(hashes, cwd)
+        
+        assert list(diffs) == hashes
+        assert diffs == expected_diffs
+        assert get_name_status_batch(hashes, cwd) == expected_name_status
+        assert threading.get_ident() not in threads
+    
+    def test_non_utf8_diff_keeps_batch(self, git_repo_with_commits, monkeypatch, git_calls):
+        """Test a commit with non-UTF-8 content is formatted without failing its batch."""
+        from moderails.utils import git
+        
+        repo_dir, commit_hash = git_repo_with_commits
+        cwd = str(repo_dir)
+        (repo_dir / "latin1.txt").write_bytes("café\n".encode("latin-1"))
+        subprocess.run(["git", "add", "latin1.txt"], cwd=repo_dir, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "add latin-1 file"], cwd=repo_dir, capture_output=True)
+        latin1_hash = get_commit_meta("HEAD", cwd)[0]
+        monkeypatch.setattr(git, "_show_cache", git.OrderedDict())
+        
+        git_calls.clear()
+        diffs = get_commit_diffs_batch([commit_hash, latin1_hash], cwd)
+        
+        assert git_calls == ["show"]
+        assert diffs[latin1_hash].startswith(f"@c {latin1_hash}\n@s add latin-1 file\n@p\n")
+        assert "+caf\ufffd" in diffs[latin1_hash]
+        assert format_commit_diff(latin1_hash, cwd) == diffs[latin1_hash]
+        assert "@s feat: add hello function" in diffs[commit_hash]
+
+
+class TestManyRefs:
+    """Tests for repositories with many refs and decoration config."""
+    
+    def test_outputs_unaffected_by_decorate_config(self, git_repo_with_commits):
+        """Test commit helpers ignore log.decorate and the refs it would load."""
+        repo_dir, commit_hash = git_repo_with_commits
+        cwd = str(repo_dir)
+        expected_meta = get_commit_meta(commit_hash, cwd)
+        expected_diff = format_commit_diff(commit_hash, cwd)
+        
+        refs = "".join(f"create refs/heads/branch-{i} {commit_hash}\n" for i in range(200))
+        subprocess.run(["git", "update-ref", "--stdin"], cwd=repo_dir, input=refs, text=True, check=True)
+        subprocess.run(["git", "config", "log.decorate", "full"], cwd=repo_dir, check=True)
+        
+        assert get_commit_meta("HEAD", cwd) == expected_meta
+        assert get_commit_diffs_batch(["HEAD"], cwd) == {"HEAD": expected_diff}
+        assert get_name_status_batch(["HEAD"], cwd) == {"HEAD": get_name_status(commit_hash, cwd)}
+
+
+class TestGetWorktreeState:
+    """Tests for get_worktree_state function."""
+    
+    def test_matches_separate_helpers(self, git_repo_with_commits):
+        """Test one status call reports what the per-question helpers do."""
+        repo_dir, _ = git_repo_with_commits
+        cwd = str(repo_dir)
+        
+        # Staged rename + modification, unstaged change, change in both,
+        # excluded lock file and an untracked file
+        (repo_dir / "poetry.lock").write_text("lock")
+        subprocess.run(["git", "add", "poetry.lock"], cwd=repo_dir, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "lock"], cwd=repo_dir, capture_output=True)
+        subprocess.run(["git", "mv", "added.py", "renamed file.py"], cwd=repo_dir, capture_output=True)
+        (repo_dir / "test.txt").write_text("staged change")
+        (repo_dir / "poetry.lock").write_text("lock v2")
+        subprocess.run(["git", "add", "test.txt", "poetry.lock"], cwd=repo_dir, capture_output=True)
+        (repo_dir / "test.txt").write_text("staged change, then more")
+        (repo_dir / "renamed file.py").write_text("def hello(): return 1")
+        (repo_dir / "untracked.py").write_text("")
+        
+        state = get_worktree_state(cwd)
+        
+        assert state == {
+            "branch": get_current_branch(cwd),
+            "staged_files": get_staged_files(cwd),
+            "unstaged_files": get_unstaged_files(cwd),
+        }
+        assert state["staged_files"] == ["renamed file.py", "test.txt"]
+        assert state["unstaged_files"] == ["renamed file.py", "test.txt"]
+    
+    def test_paths_relative_to_repo_root_from_subdirectory(self, git_repo_with_commits):
+        """Test that running from a subdirectory still reports repo-relative paths."""
+        repo_dir, _ = git_repo_with_commits
+        subdir = repo_dir / "src"
+        subdir.mkdir()
+        (subdir / "module.py").write_text("x = 1")
+        subprocess.run(["git", "add", "src/module.py"], cwd=repo_dir, capture_output=True)
+        (repo_dir / "test.txt").write_text("unstaged change")
+        
+        state = get_worktree_state(str(subdir))
+        
+        assert state["staged_files"] == ["src/module.py"] == get_staged_files(str(subdir))
+        assert state["unstaged_files"] == ["test.txt"] == get_unstaged_files(str(subdir))
+    
+    def test_not_a_repo(self, temp_dir):
+        """Test that directories outside git return None."""
+        assert get_worktree_state(str(temp_dir)) is None
+
+
+class TestFormatFilesChanged:
+    """Tests for format_files_changed function."""
+    
+    def test_merges_outputs_with_latest_status(self):
+        """Test later commits override status and renames list the new path."""
+        files = format_files_changed([
+            "A\tapp.py\nR100\told.py\tnew.py",
+            "",
+            "\nM\tapp.py",
+        ])
+        
+        assert files == "M  app.py\nR  new.py"
+
+
 class TestTruncatePatch:
     """Tests for truncate_patch function."""
     
@@ -311,3 +609,36 @@ index abc..def 100644
         # Should return original if no file boundaries detected
         assert result == patch
 
+    
+    def test_truncate_patch_counts_oversized_files(self):
+        """Test oversized files are summarised and the rest is kept verbatim."""
+        big = "".join(f"+line {i}\n" for i in range(100000))
+        patch = (
+            "diff --git a/big.txt b/big.txt\n@@ -0,0 +1,100000 @@\n" + big
+            + "diff --git a/small.txt b/small.txt\n@@ -1 +1 @@\n+small"
+        )
+        
+        assert truncate_patch(patch) == (
+            "M  [100002 lines] big.txt\n"
+            "diff --git a/small.txt b/small.txt\n@@ -1 +1 @@\n+small"
+        )
+    
+    def test_scan_show_matches_truncate_patch(self):
+        """Test streamed output split at arbitrary points truncates like the whole patch."""
+        from moderails.utils.git import _scan_show
+        
+        patch = (
+            "diff --git a/big.txt b/big.txt\nnew file mode 100644\n@@ -0,0 +1,60 @@\n"
+            + "".join(f"+line {i}\n" for i in range(60))
+            + "diff --git a/old.txt b/new.txt\nrename from old.txt\nrename to new.txt\n"
+            + "diff --git a/small.txt b/small.txt\n@@ -1 +1 @@\n+small  \n\n"
+        )
+        output = f"\x00abc\ndiff --git subject\n\n{patch}\x00def\nempty\n\n"
+        
+        for size in (1, 7, 64, len(output)):
+            chunks = [output[i:i + size] for i in range(0, len(output), size)]
+            commits = list(_scan_show(chunks, header_lines=2))
+            
+            assert [head for head, _ in commits] == ["abc\ndiff --git subject\n\n", "def\nempty\n\n"]
+            assert "\n".join(commits[0][1]) == truncate_patch(patch.rstrip())
+            assert commits[1][1] is None
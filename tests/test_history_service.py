@@ -120,6 +120,48 @@ class TestHistoryService:
         assert len(tasks) == 1
         assert tasks[0].summary == "Original summary"  # Not overwritten
     
+    def test_sync_skips_duplicates_within_file(self, test_db, temp_dir):
+        """Test that repeated entries and name-only entries are imported once."""
+        history_file = temp_dir / "history.jsonl"
+        entries = [
+            {"id": "abc123", "name": "First task", "summary": "one"},
+            {"id": "abc123", "name": "First task", "summary": "again"},
+            {"name": "Old task", "summary": "no id"},
+            {"name": "Old task", "summary": "no id again"},
+            {"name": "First task", "summary": "old entry of imported task"},
+        ]
+        history_file.write_text("".join(json.dumps(e) + "\n" for e in entries))
+        
+        service = HistoryService(test_db, history_file)
+        imported = service.sync_from_file()
+        
+        assert imported == 2
+        assert test_db.query(Task).count() == 2
+        assert test_db.query(Task).filter(Task.id == "abc123").one().summary == "one"
+    
+    def test_sync_inserts_with_defaults(self, test_db, temp_dir):
+        """Test bulk-imported rows get generated ids and column defaults."""
+        history_file = temp_dir / "history.jsonl"
+        entries = [
+            {"name": "Old task", "summary": "no id", "type": "fix"},
+            {"id": "abc123", "name": "New task", "completed_at": "2024-01-19T15:30:00"},
+        ]
+        history_file.write_text("".join(json.dumps(e) + "\n" for e in entries))
+        
+        service = HistoryService(test_db, history_file)
+        assert service.sync_from_file() == 2
+        
+        old = test_db.query(Task).filter(Task.name == "Old task").one()
+        assert len(old.id) == 6
+        assert old.type.value == "fix"
+        assert old.file_name == "old-task.md"
+        assert old.git_hash == ""
+        assert old.created_at is not None
+        
+        new = test_db.query(Task).filter(Task.id == "abc123").one()
+        assert new.summary == ""
+        assert new.completed_at == datetime(2024, 1, 19, 15, 30)
+    
     def test_sync_tracks_mtime(self, test_db, temp_dir):
         """Test that sync tracks file modification time."""
         history_file = temp_dir / "history.jsonl"
@@ -227,6 +269,20 @@ class TestHistoryService:
         # files_changed should be a list (may be empty if no staged files)
         assert isinstance(exported_task['files_changed'], list)
     
+    def test_export_task_uses_given_files_changed(self, test_db, temp_dir, monkeypatch):
+        """Test that a caller-provided file list is exported without asking git."""
+        from moderails.services import history
+        
+        history_file = temp_dir / "history.jsonl"
+        task = Task(name="Task", file_name="task.md", status=TaskStatus.COMPLETED)
+        test_db.add(task)
+        test_db.commit()
+        
+        monkeypatch.setattr(history, "get_staged_files", lambda: pytest.fail("git queried"))
+        HistoryService(test_db, history_file).export_task(task.id, files_changed=["src/app.py"])
+        
+        assert json.loads(history_file.read_text())["files_changed"] == ["src/app.py"]
+    
     def test_export_task_not_found(self, test_db, temp_dir):
         """Test exporting non-existent task raises error."""
         history_file = temp_dir / "history.jsonl"
@@ -277,6 +333,28 @@ class TestHistoryService:
         
         assert len(lines) == 1
     
+    def test_export_task_extends_cached_history(self, test_db, temp_dir):
+        """Test that exports update the cached parse instead of re-reading the file."""
+        history_file = temp_dir / "history.jsonl"
+        history_file.write_text('{"id": "old001", "name": "Old"}\n')
+        
+        tasks = [
+            Task(name=f"Task {i}", file_name="task.md", status=TaskStatus.COMPLETED)
+            for i in range(2)
+        ]
+        test_db.add_all(tasks)
+        test_db.commit()
+        
+        service = HistoryService(test_db, history_file)
+        records = service._read_records()
+        
+        for task in tasks:
+            service.export_task(task.id)
+        
+        assert service._read_records() is records
+        assert [r["id"] for r in records] == ["old001", tasks[0].id, tasks[1].id]
+        assert len(history_file.read_text().splitlines()) == 3
+    
     def test_search_by_file(self, test_db, temp_dir):
         """Test searching tasks by file path."""
         history_file = temp_dir / "history.jsonl"
@@ -353,3 +431,95 @@ class TestHistoryService:
         assert len(results2) == 1
         assert len(results3) == 1
 
+    
+    def test_search_treats_wildcards_literally(self, test_db, temp_dir):
+        """Test that % and _ in queries are matched literally, and file search keeps case."""
+        history_file = temp_dir / "history.jsonl"
+        
+        test_db.add_all([
+            Task(name="Snake case", file_name="a.md", summary="Renamed user_id", status=TaskStatus.COMPLETED),
+            Task(name="Other", file_name="b.md", summary="Touched userXid and Auth.py", status=TaskStatus.COMPLETED),
+        ])
+        test_db.commit()
+        
+        service = HistoryService(test_db, history_file)
+        
+        assert [r['name'] for r in service.search_by_query("user_id")] == ["Snake case"]
+        assert service.search_by_query("100%") == []
+        assert [r['name'] for r in service.search_by_file("Auth.py")] == ["Other"]
+        assert service.search_by_file("auth.py") == []
+    
+    def test_search_by_query_matches_each_field(self, test_db, temp_dir):
+        """Test OR terms match name or summary, but never across the two."""
+        history_file = temp_dir / "history.jsonl"
+        
+        test_db.add_all([
+            Task(name="Login page", file_name="a.md", summary=None, status=TaskStatus.DRAFT),
+            Task(name="Payments", file_name="b.md", summary="Stripe webhooks", status=TaskStatus.COMPLETED),
+        ])
+        test_db.commit()
+        
+        service = HistoryService(test_db, history_file)
+        
+        assert [r['name'] for r in service.search_by_query("login")] == ["Login page"]
+        assert sorted(r['name'] for r in service.search_by_query("page|WEBHOOK|page")) == ["Login page", "Payments"]
+        assert service.search_by_query("paymentsstripe") == []
+        assert service.search_by_query("payments stripe") == []
+    
+    def test_search_by_query_folds_non_ascii_case(self, test_db, temp_dir):
+        """Test non-ASCII capitals match case-insensitively, in the query and the text."""
+        history_file = temp_dir / "history.jsonl"
+        
+        test_db.add_all([
+            Task(name="Über Refactor", file_name="a.md", summary="Größe angepasst", status=TaskStatus.COMPLETED),
+            Task(name="Plain", file_name="b.md", summary="ascii only", status=TaskStatus.COMPLETED),
+        ])
+        test_db.commit()
+        
+        service = HistoryService(test_db, history_file)
+        
+        assert [r['name'] for r in service.search_by_query("üBER")] == ["Über Refactor"]
+        assert [r['name'] for r in service.search_by_query("GRÖSSE|GRÖßE")] == ["Über Refactor"]
+        assert [r['name'] for r in service.search_by_query("REFACTOR")] == ["Über Refactor"]
+        assert service.search_by_query("ÜBERALL") == []
+    
+    def test_search_by_query_matches_python_filter(self, test_db, temp_dir):
+        """Test SQL-backed search returns what filtering every task in Python did."""
+        history_file = temp_dir / "history.jsonl"
+        
+        texts = [
+            ("Straße bauen", "Ärger mit Öfen"), ("ÉCOLE", None), ("Kelvin \u212a", "temp"),
+            ("İstanbul", "DİL"), ("Plain", "ascii only"), ("Σίσυφος", "ΟΔΟΣ"), ("naïve", "CAFÉ"),
+        ]
+        test_db.add_all([
+            Task(name=name, file_name=f"{i}.md", summary=summary, status=TaskStatus.COMPLETED)
+            for i, (name, summary) in enumerate(texts)
+        ])
+        test_db.commit()
+        
+        service = HistoryService(test_db, history_file)
+        tasks = test_db.query(Task).all()
+        
+        for query in ("STRASSE|straße", "äRGER", "école", "K", "i", "İSTANBUL", "σίσυφος", "οδος",
+                      "NAÏVE|café", "ASCII", "x|ÉCOLE", "öfen"):
+            terms = [term.strip().lower() for term in query.split('|')]
+            expected = sorted(
+                t.name for t in tasks
+                if any(term in t.name.lower() or term in (t.summary or "").lower() for term in terms)
+            )
+            assert sorted(r['name'] for r in service.search_by_query(query)) == expected, query
+    
+    def test_history_parse_cached_until_file_changes(self, test_db, temp_dir):
+        """Test that history.jsonl is re-parsed only after it changes."""
+        history_file = temp_dir / "history.jsonl"
+        history_file.write_text('{"id": "a1", "name": "One"}\nnot json\n')
+        service = HistoryService(test_db, history_file)
+        
+        first = service._read_records()
+        assert first == [{"id": "a1", "name": "One"}]
+        assert service._read_records() is first
+        
+        with open(history_file, 'a') as f:
+            f.write('{"id": "b2", "name": "Two"}\n')
+        
+        assert [r["id"] for r in service._read_records()] == ["a1", "b2"]
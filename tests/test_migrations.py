@@ -57,6 +57,16 @@ class TestMigrations:
         # Should need migration
         assert needs_migration(db_path) is True
     
+    def test_needs_migration_after_version_update(self, temp_dir):
+        """Test that a cached version is invalidated by set_schema_version."""
+        db_path = temp_dir / "test.db"
+        set_schema_version(db_path, 0)
+        assert needs_migration(db_path) is True
+        
+        set_schema_version(db_path, CURRENT_VERSION)
+        
+        assert needs_migration(db_path) is False
+    
     def test_run_migration(self, temp_dir):
         """Test running a specific migration with multiple SQL statements."""
         db_path = temp_dir / "test.db"
@@ -167,3 +177,76 @@ class TestMigrations:
             assert fk is not None
             assert fk[2] == 'epics'  # References epics table
         engine.dispose()
+    
+    def test_migrations_create_epic_status_index(self, temp_dir):
+        """Test that migrations build the composite task index, not a single epic_id one."""
+        db_path = temp_dir / "test.db"
+        engine = create_engine(f"sqlite:///{db_path}")
+        engine.dispose()
+        set_schema_version(db_path, 0)
+        
+        run_migrations(db_path)
+        
+        engine = create_engine(f"sqlite:///{db_path}")
+        with engine.connect() as conn:
+            indexes = {row[1] for row in conn.execute(text("PRAGMA index_list(tasks)"))}
+        engine.dispose()
+        assert "ix_tasks_epic_status_completed" in indexes
+        assert "ix_tasks_epic_id" not in indexes
+    
+    def test_migration_adds_task_enum_checks(self, temp_dir):
+        """Test upgraded databases get the type/status CHECKs, with stored values converted."""
+        import sqlite3
+        
+        db_path = temp_dir / "test.db"
+        for version in range(1, 6):
+            run_migration(db_path, version)
+        set_schema_version(db_path, 5)
+        
+        conn = sqlite3.connect(db_path)
+        conn.executemany(
+            "INSERT INTO tasks (id, name, file_name, type, status) VALUES (?, ?, '', ?, ?)",
+            [
+                ("a", "names", "FIX", "IN_PROGRESS"),
+                ("b", "values", "refactor", "in-progress"),
+                ("c", "unknown", "bogus", "bogus"),
+                ("d", "null", None, None),
+            ],
+        )
+        conn.commit()
+        conn.close()
+        
+        assert auto_migrate(db_path) is True
+        
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute("SELECT id, type, status FROM tasks ORDER BY id").fetchall()
+            assert rows == [
+                ("a", "FIX", "IN_PROGRESS"),
+                ("b", "REFACTOR", "IN_PROGRESS"),
+                ("c", "FEATURE", "DRAFT"),
+                ("d", None, None),
+            ]
+            
+            with pytest.raises(sqlite3.IntegrityError):
+                conn.execute("UPDATE tasks SET status = 'in-progress' WHERE id = 'a'")
+            
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(tasks)")}
+            assert {"ix_tasks_status", "ix_tasks_created_at", "ix_tasks_epic_status_completed"} <= indexes
+        finally:
+            conn.close()
+    
+    def test_migrations_add_wal_files_to_gitignore(self, temp_dir):
+        """Test upgrades add the WAL sidecar patterns to an older .gitignore, once."""
+        db_path = temp_dir / "test.db"
+        gitignore = temp_dir / ".gitignore"
+        gitignore.write_text("# moderails database\n*.db\n*.db-journal\n\ntasks/")
+        set_schema_version(db_path, 0)
+        
+        run_migrations(db_path)
+        set_schema_version(db_path, 0)
+        run_migrations(db_path)
+        
+        assert gitignore.read_text() == (
+            "# moderails database\n*.db\n*.db-journal\n\ntasks/\n*.db-wal\n*.db-shm\n"
+        )
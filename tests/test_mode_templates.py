@@ -3,7 +3,10 @@
 import pytest
 from unittest.mock import Mock, patch
 
+from moderails.db.models import TaskStatus
 from moderails.modes import get_mode
+from moderails.services.epic import EpicService
+from moderails.services.task import TaskService
 from moderails.utils.context import build_mode_context, get_in_progress_task, get_draft_tasks
 
 
@@ -395,13 +398,21 @@ class TestBuildModeContext:
         mock_task = Mock()
         mock_task.id = "abc123"
         mock_task.name = "Test Task"
-        mock_task.status = Mock(value="draft")
+        mock_task.status = TaskStatus.IN_PROGRESS
         mock_task.file_name = "tasks/test.plan.md"
         mock_task.type = Mock(value="feature")
         mock_task.epic = None
         
+        mock_draft = Mock()
+        mock_draft.id = "def456"
+        mock_draft.name = "Draft Task"
+        mock_draft.status = TaskStatus.DRAFT
+        mock_draft.file_name = ""
+        mock_draft.type = Mock(value="fix")
+        mock_draft.epic = None
+        
         mock_task_service = Mock()
-        mock_task_service.list_all.return_value = [mock_task]
+        mock_task_service.list_by_statuses.return_value = [mock_draft, mock_task]
         
         mock_epic_service = Mock()
         mock_epic_service.list_all.return_value = []
@@ -416,6 +427,8 @@ class TestBuildModeContext:
         
         assert context.get("current_task") is not None
         assert context["current_task"]["id"] == "abc123"
+        assert [t["id"] for t in context["draft_tasks"]] == ["def456"]
+        mock_task_service.list_all.assert_not_called()
         assert context.get("epics") == []
         assert context.get("flags") == []
     
@@ -441,18 +454,64 @@ class TestBuildModeContext:
         assert context["memories"] == ["auth", "payments"]
         assert "src/" in context["files_tree"]
     
+    @patch('moderails.utils.context.get_project_root', return_value=None)
+    def test_build_context_research_mode_keeps_db_work_on_caller_thread(self, mock_root):
+        """Test file loaders may run in the background but DB lookups don't."""
+        import threading
+        
+        caller = threading.get_ident()
+        threads = {}
+        
+        def record(name, value):
+            def side_effect(*args, **kwargs):
+                threads[name] = threading.get_ident()
+                return value
+            return side_effect
+        
+        mock_context_service = Mock()
+        mock_context_service.load_mandatory_context.side_effect = record("mandatory", "Mandatory content")
+        mock_context_service.list_memories.side_effect = record("memories", ["auth"])
+        mock_context_service.get_files_tree.side_effect = record("files_tree", None)
+        
+        mock_task = Mock()
+        mock_task.id = "abc123"
+        mock_task.name = "test-task"
+        mock_task.status.value = "in-progress"
+        mock_task.file_name = None
+        mock_task.type.value = "feature"
+        mock_task.epic.id = "ep1234"
+        mock_task.epic.name = "auth"
+        
+        mock_task_service = Mock()
+        mock_task_service.list_all.side_effect = record("task", [mock_task])
+        mock_epic_service = Mock()
+        mock_epic_service.get_summary.side_effect = record("epic", "Epic summary")
+        
+        services = {
+            "task": mock_task_service,
+            "context": mock_context_service,
+            "epic": mock_epic_service,
+        }
+        
+        context = build_mode_context(services, "research")
+        
+        assert context["mandatory_context"] == "Mandatory content"
+        assert context["memories"] == ["auth"]
+        assert context["current_task"]["id"] == "abc123"
+        assert context["epic_context"] == "Epic summary"
+        assert threads["task"] == caller
+        assert threads["epic"] == caller
+    
     @patch('moderails.utils.context.is_private_mode')
-    @patch('moderails.utils.context.is_git_repo')
-    @patch('moderails.utils.context.get_current_branch')
-    @patch('moderails.utils.context.get_staged_files')
-    @patch('moderails.utils.context.get_unstaged_files')
-    def test_build_context_complete_mode(self, mock_unstaged, mock_staged, mock_branch, mock_is_git_repo, mock_is_private):
+    @patch('moderails.utils.context.get_worktree_state')
+    def test_build_context_complete_mode(self, mock_worktree_state, mock_is_private):
         """Test complete mode gets git state."""
         mock_is_private.return_value = False
-        mock_is_git_repo.return_value = True
-        mock_branch.return_value = "main"
-        mock_staged.return_value = ["file1.ts"]
-        mock_unstaged.return_value = ["file2.ts"]
+        mock_worktree_state.return_value = {
+            "branch": "main",
+            "staged_files": ["file1.ts"],
+            "unstaged_files": ["file2.ts"],
+        }
         
         mock_task = Mock()
         mock_task.id = "abc123"
@@ -478,6 +537,45 @@ class TestBuildModeContext:
         assert context["git"]["is_main"] is True
         assert context["git"]["staged_files"] == ["file1.ts"]
         assert context["git"]["unstaged_files"] == ["file2.ts"]
+    
+    def test_task_dicts_load_epics_in_the_task_query(self, test_db, temp_dir, sql_statements):
+        """Test draft/in-progress task dicts include epics without a query per task."""
+        epic_service = EpicService(test_db)
+        task_service = TaskService(test_db, temp_dir)
+        epics = [epic_service.create("epic-a"), epic_service.create("epic-b")]
+        for i in range(6):
+            task_service.create(f"draft-{i}", epics[i % 2].id, status=TaskStatus.DRAFT)
+        task_service.create("current", epics[0].id)
+        test_db.expire_all()
+        services = {"task": task_service}
+        
+        with sql_statements(test_db) as statements:
+            drafts = get_draft_tasks(services)
+            current = get_in_progress_task(services)
+        
+        assert [d["epic"]["name"] for d in drafts] == ["epic-a", "epic-b"] * 3
+        assert current["epic"]["name"] == "epic-a"
+        assert len(statements) == 2
+    
+    @patch('moderails.utils.context.get_project_root', return_value=None)
+    def test_plan_mode_creates_plan_file_without_refetch(self, mock_project_root, test_db, temp_dir):
+        """Test plan mode fills in the new plan file without reloading the task."""
+        epic_service = EpicService(test_db)
+        task_service = TaskService(test_db, temp_dir)
+        epic = epic_service.create("test-epic")
+        task_service.create("current", epic.id)
+        services = {"task": task_service}
+        
+        list_calls = []
+        real_list_all = task_service.list_all
+        task_service.list_all = lambda *args, **kwargs: list_calls.append(kwargs) or real_list_all(*args, **kwargs)
+        
+        context = build_mode_context(services, "plan")
+        
+        assert len(list_calls) == 1
+        assert context["current_task"]["has_plan_file"] is True
+        assert (temp_dir / context["current_task"]["file_name"]).exists()
+        assert context["current_task"] == get_in_progress_task(services)
 
 
 class TestModeFlags:
@@ -558,3 +656,100 @@ class TestModeFlags:
         assert "STOP and WAIT" in rendered or "STOP and wait" in rendered.lower()
         # Should NOT have batch mode header
         assert "BATCH MODE" not in rendered
+
+
+class TestModeFileCache:
+    """Test cached reads of mode files."""
+    
+    def test_full_protocol_contains_all_modes_in_order(self):
+        """Test full protocol joins every mode file and is reused between calls."""
+        from moderails.modes import MODE_FILES, get_full_protocol
+        
+        protocol = get_full_protocol()
+        
+        assert protocol.count("\n\n---\n\n") >= len(MODE_FILES) - 1
+        assert get_full_protocol() is protocol
+    
+    def test_cached_read_reloads_on_mtime_change(self, temp_dir):
+        """Test that an edited file is re-read instead of served from cache."""
+        import os
+        from moderails.modes import _read_cached
+        
+        path = temp_dir / "mode.md"
+        path.write_text("first")
+        assert _read_cached(path) == "first"
+        
+        path.write_text("second")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        assert _read_cached(path) == "second"
+        assert _read_cached(temp_dir / "missing.md") is None
+    
+    def test_templated_mode_compiled_once(self):
+        """Test that templated modes reuse the compiled template across renders."""
+        from moderails.modes import _ENV
+        
+        get_mode("start", {})
+        first = _ENV.get_template("start.md")
+        get_mode("start", {})
+        
+        assert _ENV.get_template("start.md") is first
+    
+    def test_protocol_partial_read_once(self):
+        """Test that the packaged protocol partial is read from disk only once."""
+        from moderails.utils.context import load_protocol_partial
+        
+        load_protocol_partial.cache_clear()
+        with patch("pathlib.Path.read_text", return_value="# Protocol") as mock_read:
+            first = load_protocol_partial()
+            second = load_protocol_partial()
+        load_protocol_partial.cache_clear()
+        
+        assert first == second == "# Protocol"
+        assert mock_read.call_count == 1
+    
+    def test_project_root_cached_once_found(self, temp_dir, monkeypatch):
+        """Test a found project root is reused, while a miss is looked up again."""
+        import os
+        from moderails.db.database import init_db
+        from moderails.utils import context
+        
+        monkeypatch.setattr(context, "_project_roots", {})
+        os.chdir(temp_dir)
+        
+        assert context.get_project_root() is None
+        init_db()
+        root = context.get_project_root()
+        assert root == temp_dir.resolve()
+        
+        with patch("moderails.utils.context.find_db_path", side_effect=AssertionError("walked again")):
+            assert context.get_project_root() == root
+
+
+class TestRerailContext:
+    """Tests for build_rerail_context() function."""
+    
+    def test_rerail_includes_protocol_mandatory_context_and_plan(self, test_db, temp_dir):
+        """Test the resumed session lists every section in order."""
+        from moderails.services.context import ContextService
+        from moderails.services.session import SessionService
+        from moderails.utils.context import build_rerail_context
+        
+        task_service = TaskService(test_db, temp_dir)
+        session_service = SessionService(test_db, temp_dir)
+        context_service = ContextService(temp_dir)
+        context_service.ensure_directories()
+        (context_service.mandatory_dir / "rules.md").write_text("Always run tests")
+        
+        task = task_service.create("resume-me")
+        task_service.create_plan_file(task.id)
+        session_service.ensure_active(task.id)
+        services = {"task": task_service, "session": session_service, "context": context_service}
+        
+        output = build_rerail_context(services, task, temp_dir)
+        
+        assert f"**Project**: `{temp_dir}`" in output
+        assert output.index("## MANDATORY CONTEXT") < output.index("Always run tests") < output.index("## Task Plan")
+        assert f"File: `_moderails/{task.file_name}`" in output
+        assert output.endswith("suggest `#research` to begin analysis.")
@@ -1,7 +1,12 @@
 """Tests for service modules."""
 
+import pytest
+from pathlib import Path
+from sqlalchemy.orm import sessionmaker
+
 from moderails.db.models import Task, TaskStatus
 from moderails.services.epic import EpicService
+from moderails.services.session import SessionService
 from moderails.services.task import TaskService
 
 
@@ -17,6 +22,24 @@ class TestEpicService:
         assert epic.name == "test-epic"
         assert epic.id is not None
     
+    def test_create_epic_returns_persistent_instance(self, test_db):
+        """Test the created epic is the session's instance with defaults applied."""
+        service = EpicService(test_db)
+        
+        epic = service.create("test-epic")
+        
+        assert len(epic.id) == 6
+        assert epic.get_skills() == []
+        assert service.get(epic.id) is epic
+    
+    def test_create_epic_rejects_non_slug(self, test_db):
+        """Test that epic names must be slugs (no trailing newline either)."""
+        service = EpicService(test_db)
+        
+        for bad_name in ["My Epic", "epic-", "-epic", "epic--x", "epic\n"]:
+            with pytest.raises(ValueError):
+                service.create(bad_name)
+    
     def test_get_epic(self, test_db):
         """Test getting an epic by ID."""
         service = EpicService(test_db)
@@ -37,6 +60,35 @@ class TestEpicService:
         assert found is not None
         assert found.name == "my-epic"
     
+    def test_get_by_name_queries_once(self, test_db, sql_statements):
+        """Test repeated name lookups are served without another query."""
+        service = EpicService(test_db)
+        service.create("my-epic")
+        other = EpicService(test_db)
+        
+        with sql_statements(test_db) as statements:
+            first = other.get_by_name("my-epic")
+            second = other.get_by_name("my-epic")
+        
+        assert first is second
+        assert len([s for s in statements if "FROM epics" in s]) == 1
+    
+    def test_get_by_name_after_rename(self, test_db):
+        """Test a renamed epic is no longer found under its old name."""
+        service = EpicService(test_db)
+        epic = service.create("old-name")
+        assert service.get_by_name("old-name") is epic
+        
+        # As `epic update --name` does
+        epic.name = "new-name"
+        test_db.commit()
+        
+        assert service.get_by_name("old-name") is None
+        assert service.get_by_name("new-name") is epic
+        
+        replacement = service.create("old-name")
+        assert service.get_by_name("old-name") is replacement
+    
     def test_list_all(self, test_db):
         """Test listing all epics."""
         service = EpicService(test_db)
@@ -157,6 +209,32 @@ class TestTaskService:
         task_file = temp_dir / file_path
         assert task_file.exists()
     
+    def test_create_plan_file_creates_folder_once(self, test_db, temp_dir, monkeypatch):
+        """Test that plan files in the same folder only mkdir it once."""
+        epic_service = EpicService(test_db)
+        epic = epic_service.create("test-epic")
+        
+        task_service = TaskService(test_db, temp_dir)
+        first = task_service.create("first-task", epic.id, status=TaskStatus.DRAFT)
+        second = task_service.create("second-task", epic.id, status=TaskStatus.DRAFT)
+        
+        # Parent exists, so each real mkdir of the epic folder is one call
+        (temp_dir / "tasks").mkdir()
+        mkdir_calls = []
+        original_mkdir = Path.mkdir
+        
+        def counting_mkdir(self, *args, **kwargs):
+            mkdir_calls.append(self)
+            return original_mkdir(self, *args, **kwargs)
+        
+        monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+        
+        task_service.create_plan_file(first.id)
+        task_service.create_plan_file(second.id)
+        
+        assert mkdir_calls == [temp_dir / "tasks" / "test-epic"]
+        assert (temp_dir / second.file_name).exists()
+    
     def test_get_task(self, test_db, temp_dir):
         """Test getting a task by ID."""
         epic_service = EpicService(test_db)
@@ -170,6 +248,18 @@ class TestTaskService:
         assert found is not None
         assert found.id == created.id
     
+    def test_get_task_uses_identity_map(self, test_db, temp_dir, sql_statements):
+        """Test that fetching an already-loaded task issues no SQL."""
+        task_service = TaskService(test_db, temp_dir)
+        task = task_service.create("test-task")
+        task_service.get(task.id)
+        
+        with sql_statements(test_db) as statements:
+            found = task_service.get(task.id)
+        
+        assert found is task
+        assert statements == []
+    
     def test_get_by_name(self, test_db, temp_dir):
         """Test getting task by name."""
         epic_service = EpicService(test_db)
@@ -214,6 +304,21 @@ class TestTaskService:
         assert len(tasks) == 1
         assert tasks[0].name == "task1"
     
+    def test_list_by_statuses(self, test_db, temp_dir, sql_statements):
+        """Test listing tasks in several statuses at once."""
+        task_service = TaskService(test_db, temp_dir)
+        task_service.create("draft", status=TaskStatus.DRAFT)
+        task_service.create("current")
+        task_service.create("done", status=TaskStatus.COMPLETED)
+        
+        with sql_statements(test_db) as statements:
+            tasks = task_service.list_by_statuses([TaskStatus.IN_PROGRESS, TaskStatus.DRAFT])
+        
+        assert sorted(t.name for t in tasks) == ["current", "draft"]
+        # Listing columns only - the wide text columns are left unloaded
+        assert "tasks.description" not in statements[0]
+        assert "tasks.summary" not in statements[0]
+    
     def test_update_task(self, test_db, temp_dir):
         """Test updating a task."""
         epic_service = EpicService(test_db)
@@ -231,6 +336,46 @@ class TestTaskService:
         assert updated.status == TaskStatus.IN_PROGRESS  # Still in-progress
         assert updated.summary == "New summary"
     
+    def test_update_task_without_changes_skips_commit(self, test_db, temp_dir, sql_statements):
+        """Test that a no-op update returns the task without writing."""
+        epic_service = EpicService(test_db)
+        epic = epic_service.create("test-epic")
+        
+        task_service = TaskService(test_db, temp_dir)
+        task = task_service.create("test-task", epic.id, summary="Same")
+        
+        with sql_statements(test_db) as statements:
+            updated = task_service.update(task.id)
+            same = task_service.update(task.id, summary="Same")
+        
+        assert updated is task
+        assert same is task
+        assert not any(s.startswith("UPDATE") for s in statements)
+    
+    def test_writes_keep_instance_current_without_refresh(self, test_db, temp_dir, sql_statements):
+        """Test create/update/complete results match the database with expire_on_commit=False."""
+        db = sessionmaker(bind=test_db.get_bind(), expire_on_commit=False)()
+        epic_service = EpicService(db)
+        first_epic = epic_service.create("first-epic")
+        second_epic = epic_service.create("second-epic")
+        task_service = TaskService(db, temp_dir)
+        
+        with sql_statements(db) as statements:
+            task = task_service.create("test-task", first_epic.id)
+            assert task.created_at is not None
+            # Validation SELECTs run first; nothing is re-read after the INSERT
+            after_insert = statements[[s.startswith("INSERT") for s in statements].index(True):]
+            assert not any(s.startswith("SELECT") for s in after_insert)
+        
+        task_service.update(task.id, epic_id=second_epic.id)
+        assert task.epic.name == "second-epic"
+        
+        task_service.complete(task.id)
+        completed_at = task.completed_at
+        db.expire(task)
+        assert task.completed_at == completed_at
+        db.close()
+    
     def test_delete_task(self, test_db, temp_dir):
         """Test deleting a task."""
         epic_service = EpicService(test_db)
@@ -261,6 +406,16 @@ class TestTaskService:
         assert "# TASK NAME" in content
         assert "SUMMARY" in content
     
+    def test_plan_file_removed_outside_moderails(self, test_db, temp_dir):
+        """Test content lookup and delete tolerate a plan file deleted by hand."""
+        task_service = TaskService(test_db, temp_dir)
+        task = task_service.create("test-task")
+        file_name = task_service.create_plan_file(task.id)
+        (temp_dir / file_name).unlink()
+        
+        assert task_service.get_task_content(task.id) is None
+        assert task_service.delete(task.id) is True
+    
     def test_single_in_progress_enforcement(self, test_db, temp_dir):
         """Test that only one task can be in-progress at a time."""
         import pytest
@@ -314,3 +469,26 @@ class TestTaskService:
         assert task2 is not None
         assert task2.status == TaskStatus.IN_PROGRESS
 
+
+
+class TestSessionService:
+    """Tests for SessionService."""
+    
+    def test_get_active_loads_task_in_same_query(self, test_db, temp_dir, sql_statements):
+        """Test the active session, its task and epic come back in one query."""
+        epic = EpicService(test_db).create("test-epic")
+        task = Task(name="task", file_name="t.md", status=TaskStatus.IN_PROGRESS, epic_id=epic.id)
+        test_db.add(task)
+        test_db.commit()
+        
+        task_id = task.id
+        service = SessionService(test_db, temp_dir)
+        service.ensure_active(task_id)
+        test_db.expunge_all()
+        
+        with sql_statements(test_db) as statements:
+            context = service.get_full_context()
+        
+        assert context["task"]["id"] == task_id
+        assert context["epic"]["name"] == "test-epic"
+        assert len(statements) == 1